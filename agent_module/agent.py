@@ -1,22 +1,36 @@
     # agent.py
 
-import os
-import sys
-from pydantic import create_model, Field
-from typing import List, Tuple
-import json
-from enum import Enum
+import asyncio
+import logging
+import time
+import uuid
+from contextvars import ContextVar
+import orjson
 
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from state_module.state_handler import StateHandler
 # Assuming ArkModelLink.generate_response is actually ArkModelLink.agenerate_response
-from model_module.ArkModelNew import ArkModelLink, AIMessage, SystemMessage
+from model_module.ArkModelNew import ArkModelLink, AIMessage, SystemMessage, UserMessage
 from memory_module.memory import Memory
 
 
+logger = logging.getLogger(__name__)
+
 MAX_ITER = 10
 
+TRANSITION_PROMPT_PREFIX = (
+    "given the context of the conversation and the following state options, "
+    "output the most reasonable next state. "
+    "do not use tool result to determine the next state\n"
+    "state options:\n"
+)
+
+# set by step_stream, free-text LLM output is pushed here as it is generated
+_stream_queue: ContextVar = ContextVar("_stream_queue", default=None)
+
+# pushed to the stream queue before each free-text reply
+_NEW_REPLY = object()
+
 
 class Agent:
     """
@@ -31,13 +45,30 @@ class Agent:
         memory: Memory,
         llm: ArkModelLink,
         tool_manager=None,
+        semantic_cache=None,
+        system_prompt: str = "",
+        llm_concurrency: int = 8,
     ):
         self.agent_id = agent_id
         self.flow = flow
         self.memory = memory
         self.llm = llm
         self.tool_manager = tool_manager
+        self.semantic_cache = semantic_cache
+
+        # caps in-flight LLM calls so bursts queue here instead of at the backend
+        self.llm_semaphore = asyncio.Semaphore(llm_concurrency)
+
+        # kept byte-identical across turns so the provider can reuse its prefix cache
+        self.system_message = SystemMessage(content=system_prompt)
+
+        # (last user turn, k) -> long term memory message, reused within a step
+        self.last_user_message = ""
+        self._long_term_cache = None
+        # state name -> transition prompt SystemMessage, built on first use
+        self._transition_messages = {}
         self.current_state = self.flow.get_initial_state()
+        self._reply_state = self.flow.get_state("agent_reply")
 
         self.startup_flag = True
         self.tools = []
@@ -53,30 +84,6 @@ class Agent:
     #    self.bind_tool(tool)
     #    self.tool_names.append(tool_name)
 
-    def create_next_state_class(self, options: List[Tuple[str, str]]):
-        """
-        options: list of tuples (next_state, description of state)
-        Returns a Pydantic model class with a single field 'next_state',
-        whose value must be one of the provided state names.
-        """
-
-        # Dynamically build an Enum of allowed states
-        enum_dict = {state: state for state, desc in options}
-
-        # add desc into enum dict
-        next_state_enum = Enum("NextStateEnum", enum_dict)
-
-        # Build the model with a single constrained field
-        next_state_model = create_model(
-            "NextState",
-            next_state=(
-                next_state_enum,
-                Field(..., description="The chosen next state"),
-            ),
-        )
-
-        return next_state_model
-
     async def call_llm(self, context=None, json_schema=None):
         """
         Agent's interface with chat model
@@ -86,8 +93,38 @@ class Agent:
         """
 
         chat_model = self.llm
+        stream_queue = _stream_queue.get()
+
+        # structured calls are state transitions, their answer depends on where
+        # the state loop is, not only on the conversation, so they skip the cache
+        cache = self.semantic_cache if json_schema is None else None
+        query = None
+
+        if cache is not None:
+            query, context_hash = cache.key_parts(context)
+            if query:
+                embedding = await asyncio.to_thread(cache.embed, query)
+                cached = cache.lookup(embedding, context_hash)
+                if cached is not None:
+                    if stream_queue is not None:
+                        stream_queue.put_nowait(_NEW_REPLY)
+                        stream_queue.put_nowait(cached)
+                    return AIMessage(content=cached)
+
+        async with self.llm_semaphore:
+            if stream_queue is not None and json_schema is None:
+                parts = []
+                stream_queue.put_nowait(_NEW_REPLY)
+                async for delta in chat_model.generate_response_stream(context):
+                    parts.append(delta)
+                    stream_queue.put_nowait(delta)
+                llm_response = "".join(parts)
+            else:
+                llm_response = await chat_model.generate_response(context, json_schema)
 
-        llm_response = await chat_model.generate_response(context, json_schema)
+        # make_llm_call reports failures as an "Error: ..." string, never cache those
+        if query and llm_response and not llm_response.startswith("Error:"):
+            cache.insert(embedding, context_hash, llm_response)
 
         # else:
         #    messages = [SystemMessage(content=input)]
@@ -100,64 +137,87 @@ class Agent:
         Chooses subsequent transition in state graph
         """
 
-        transition_tuples = list(zip(transitions_dict["tt"], transitions_dict["td"]))
-        prompt = f"""given the context of the conversation and the following state options {transition_tuples} output the most reasonable next state. 
-                 do not use tool result to determine the next state"""
-
+        # prompt and schema envelope are precomputed when the state graph is loaded
+        state = self.current_state
+        prompt_message = self._transition_messages.get(state.name)
+        if prompt_message is None:
+            prompt_message = SystemMessage(
+                content=TRANSITION_PROMPT_PREFIX + state.transition_prompt
+            )
+            self._transition_messages[state.name] = prompt_message
 
-
-        # creates pydantic class and a model dump
-        NextStates = self.create_next_state_class(transition_tuples)
-        json_schema = {
-            "type": "json_schema",
-            "json_schema": {
-                "name": "class_options",
-                "schema": NextStates.model_json_schema(),
-            },
-        }
-
-        context_text = [SystemMessage(content=prompt)] + messages
+        context_text = [prompt_message, *messages]
 
         
-        output = await self.call_llm(context=context_text, json_schema=json_schema)
+        output = await self.call_llm(
+            context=context_text, json_schema=state.next_state_schema_envelope
+        )
 
         
-        structured_output = json.loads(output.content)
+        structured_output = orjson.loads(output.content)
         
 
         next_state_name = structured_output["next_state"]
 
         return next_state_name
 
-    def add_context(self, messages):
+    async def add_context(self, messages):
         """
         processes incoming messages for memory module
         """
 
         assert isinstance(messages, list), "agent.py messages not a list"
 
+        # one database round trip for the whole batch
+        await self.memory.add_memories_async(messages)
+
         for message in messages:
-            self.memory.add_memory(message)
+            if isinstance(message, UserMessage):
+                self.last_user_message = message.content
 
         return None
 
-    def get_context(self, turns=5):
+    async def get_context(self, turns=5, k=20, short_term=None):
         """
 
         wrap long term and short term into context window
+        k caps the number of long term memories retrieved
+        short_term skips the short term fetch when the caller already has it
         output: list of messages
 
         """
 
-        short_term_mem = self.memory.retrieve_short_memory(turns)
-
-        long_term_mem = self.memory.retrieve_long_memory(context=short_term_mem)
+        # long term retrieval is keyed on the last user message only, so it
+        # does not depend on the short term fetch and both can run together;
+        # it skips the newest `turns` rows, which the short term window holds
+        key = (hash(self.last_user_message), k, turns)
+        need_long_term = self._long_term_cache is None or self._long_term_cache[0] != key
+
+        if short_term is None and need_long_term:
+            short_term, long_term_mem = await asyncio.gather(
+                self.memory.retrieve_short_memory_async(turns),
+                self.memory.retrieve_long_memory_async(
+                    self.last_user_message, k, exclude_recent=turns
+                ),
+            )
+            self._long_term_cache = (key, long_term_mem)
+        elif short_term is None:
+            short_term = await self.memory.retrieve_short_memory_async(turns)
+        elif need_long_term:
+            long_term_mem = await self.memory.retrieve_long_memory_async(
+                self.last_user_message, k, exclude_recent=turns
+            )
+            self._long_term_cache = (key, long_term_mem)
+
+        short_term_mem = short_term
+        long_term_mem = self._long_term_cache[1]
 
         # output = {"relevant_memories": long_term_mem,
         #           "conversation_history": short_term_mem,
         # }
 
-        output = [long_term_mem] + short_term_mem
+        # static system prompt first, per-query memories after it
+        output = [self.system_message, long_term_mem] + short_term_mem
 
         return output
 
@@ -171,9 +231,9 @@ class Agent:
 
         ## process messages
 
-        self.add_context(messages)
+        await self.add_context(messages)
 
-        print("agent.py recieved message")
+        logger.debug("agent.py recieved message")
 
         # messages_list = self.context.get("messages", [])
         # messages_list = self.memory.retrieve_memory()
@@ -183,38 +243,41 @@ class Agent:
 
         last_ai_message = None
 
-        retry_count = 0
-        print("agent.py CURR STATE: ", self.current_state)
-        print("agent.py IS TERMINAL?:", self.current_state.is_terminal)
+        logger.debug("agent.py CURR STATE: %s", self.current_state)
+        logger.debug("agent.py IS TERMINAL?: %s", self.current_state.is_terminal)
 
-        while not self.current_state.is_terminal:
-            print("Inner loop")
-            ### DEBUGGING
+        # refetched only after add_context changes it, the first get_context
+        # fetches it together with long term memory
+        short_term = None
 
-            if retry_count > MAX_ITER:
-                print("MAX ITER REACHED")
+        for _ in range(MAX_ITER):
+            if self.current_state.is_terminal:
+                logger.debug("REACHED TERMINAL")
                 break
-            retry_count += 1
+            logger.debug("Inner loop")
 
             ### DEBUGGING
             # print("MSGS_LIST", messages_list[-1])
 
-            context = self.get_context()
+            context = await self.get_context(short_term=short_term)
+            short_term = context[2:]
             update = await self.current_state.run(context, self)
-            print("inner_loop_update: ", update)
+            logger.debug("inner_loop_update: %s", update)
             if update:
                 # messages_list.append(update)
                 update_list = [update]
-                self.add_context(update_list)  # add update to memory
+                await self.add_context(update_list)  # add update to memory
+                short_term = await self.memory.retrieve_short_memory_async(5)
 
                 if isinstance(update, AIMessage):
                     last_ai_message = update
 
-            if self.current_state.is_terminal:
-                print("REACHED TERMINAL")
-                break
+            if self.current_state.static_next is not None:
+                self.current_state = self.flow.get_state(self.current_state.static_next)
+                logger.debug("agent.py CURR STATE: %s", self.current_state)
+                continue
 
-            messages_list = self.memory.retrieve_short_memory(5)
+            messages_list = short_term
             if self.current_state.check_transition_ready(messages_list):
                 transition_dict = self.flow.get_transitions(
                     self.current_state, messages_list
@@ -230,16 +293,81 @@ class Agent:
                     )
 
                 self.current_state = self.flow.get_state(next_state_name)
-                print("agent.py CURR STATE: ", self.current_state)
+                logger.debug("agent.py CURR STATE: %s", self.current_state)
 
 
             else:
-                print("REACHED NO NEXT STATE")
+                logger.debug("REACHED NO NEXT STATE")
                 break  # No transition ready, exit gracefully
-        print("LAST_AI_MSG", last_ai_message)
-        self.current_state = self.flow.get_state("agent_reply")
+        else:
+            if not self.current_state.is_terminal:
+                logger.warning("MAX ITER REACHED")
+
+        logger.debug("LAST_AI_MSG %s", last_ai_message)
+        self.current_state = self._reply_state
         return last_ai_message
 
+    def _stream_chunk(self, chunk_id, created, model, delta, finish_reason=None):
+        """Formats one OpenAI chat.completion.chunk as a server-sent event."""
+        chunk = {
+            "id": chunk_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": model,
+            "choices": [
+                {"index": 0, "delta": delta, "finish_reason": finish_reason}
+            ],
+        }
+        return f"data: {orjson.dumps(chunk).decode()}\n\n"
+
+    async def step_stream(self, messages, model="ark-agent"):
+        """
+        Streaming variant of step.
+        Runs the same state loop and yields free-text LLM output as
+        server-sent chat.completion.chunk events.
+        The loop can reply several times (agent_reply -> agent_reply) and only
+        the last reply is the answer, so each reply is held back until a later
+        one replaces it or the loop ends.
+        """
+
+        queue = asyncio.Queue()
+
+        async def run_step():
+            try:
+                await self.step(messages)
+            finally:
+                queue.put_nowait(None)
+
+        token = _stream_queue.set(queue)
+        try:
+            # the task copies the current context, and with it the queue
+            task = asyncio.create_task(run_step())
+        finally:
+            _stream_queue.reset(token)
+
+        chunk_id = f"chatcmpl-{uuid.uuid4().hex[:8]}"
+        created = int(time.time())
+
+        yield self._stream_chunk(chunk_id, created, model, {"role": "assistant"})
+
+        reply = []
+        while (delta := await queue.get()) is not None:
+            if delta is _NEW_REPLY:
+                reply = []
+            else:
+                reply.append(delta)
+
+        await task
+
+        for delta in reply:
+            yield self._stream_chunk(chunk_id, created, model, {"content": delta})
+
+        if not reply:
+            yield self._stream_chunk(chunk_id, created, model, {"content": "(no response)"})
+
+        yield self._stream_chunk(chunk_id, created, model, {}, finish_reason="stop")
+        yield "data: [DONE]\n\n"
+
 
 if __name__ == "__main__":
     pass
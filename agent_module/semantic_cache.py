@@ -0,0 +1,94 @@
+# semantic_cache.py
+
+import hashlib
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import numpy as np
+import orjson
+
+
+class SemanticCache:
+    """
+    In-memory semantic cache for free-text LLM responses.
+
+    An entry is keyed on the embedding of the last user turn plus an exact
+    hash of every other non-system message of the context (earlier turns,
+    tool results, replies already given in this step). A lookup only hits
+    when that hash matches and the user turn is similar enough, so the same
+    question asked over a different conversation or tool result is a miss.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        threshold: float = 0.87,
+        max_entries: int = 1024,
+    ):
+        self.model_name = model_name
+        self.threshold = threshold
+        self.max_entries = max_entries
+
+        # loaded on first embed, sentence-transformers is heavy to import
+        self._encoder = None
+
+        # key -> (normalized embedding, response, context hash), LRU ordered
+        self.entries = OrderedDict()
+        self._next_key = 0
+
+    @staticmethod
+    def key_parts(context: List) -> Tuple[str, str]:
+        """
+        Splits a context into (last user turn, hash of the rest).
+
+        System messages are left out of the hash, the system prompt and long
+        term memories are derived from the conversation itself.
+        """
+        last_user = None
+        for i in range(len(context) - 1, -1, -1):
+            if getattr(context[i], "role", None) == "user":
+                last_user = i
+                break
+        if last_user is None:
+            return "", ""
+
+        rest = [
+            (msg.role, msg.content)
+            for i, msg in enumerate(context)
+            if i != last_user and getattr(msg, "role", None) != "system"
+        ]
+        digest = hashlib.sha256(orjson.dumps(rest)).hexdigest()
+        return context[last_user].content, digest
+
+    def embed(self, text: str) -> np.ndarray:
+        """Returns the normalized embedding of text."""
+        if self._encoder is None:
+            from sentence_transformers import SentenceTransformer
+
+            self._encoder = SentenceTransformer(self.model_name)
+        return self._encoder.encode(text, normalize_embeddings=True)
+
+    def lookup(self, embedding: np.ndarray, context_hash: str) -> Optional[str]:
+        """Returns the cached response for the closest match, or None on a miss."""
+        keys = [k for k, v in self.entries.items() if v[2] == context_hash]
+        if not keys:
+            return None
+
+        matrix = np.stack([self.entries[k][0] for k in keys])
+        scores = matrix @ embedding
+        best = int(np.argmax(scores))
+
+        if scores[best] < self.threshold:
+            return None
+
+        key = keys[best]
+        self.entries.move_to_end(key)
+        return self.entries[key][1]
+
+    def insert(self, embedding: np.ndarray, context_hash: str, response: str):
+        """Stores a response, evicting the least recently used entry if full."""
+        self.entries[self._next_key] = (embedding, response, context_hash)
+        self._next_key += 1
+
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from agent_module.agent import Agent
+from agent_module.semantic_cache import SemanticCache
+from model_module.ArkModelNew import AIMessage, SystemMessage, ToolMessage, UserMessage
+
+
+class FakeCache(SemanticCache):
+    """SemanticCache with a fixed embedding, so every user turn is similar."""
+
+    def embed(self, text):
+        return np.array([1.0, 0.0])
+
+
+class FakeFlow:
+    def get_initial_state(self):
+        return None
+
+    def get_state(self, name):
+        return None
+
+
+class FakeLLM:
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_response(self, context, json_schema=None):
+        self.calls += 1
+        return f"reply {self.calls}"
+
+
+def make_agent(cache):
+    return Agent(agent_id="test", flow=FakeFlow(), memory=None, llm=FakeLLM(), semantic_cache=cache)
+
+
+def test_key_parts_split_last_user_turn():
+    context = [
+        SystemMessage(content="prompt"),
+        UserMessage(content="first"),
+        AIMessage(content="answer"),
+        UserMessage(content="second"),
+    ]
+
+    query, context_hash = SemanticCache.key_parts(context)
+    assert query == "second"
+
+    # system messages do not change the key, earlier turns do
+    assert SemanticCache.key_parts(context[1:])[1] == context_hash
+    assert SemanticCache.key_parts(context[3:])[1] != context_hash
+
+
+def test_lookup_requires_same_context_hash():
+    cache = SemanticCache(threshold=0.9)
+    cache.insert(np.array([1.0, 0.0]), "ctx", "cached")
+
+    assert cache.lookup(np.array([1.0, 0.0]), "ctx") == "cached"
+    assert cache.lookup(np.array([1.0, 0.0]), "other") is None
+    assert cache.lookup(np.array([0.0, 1.0]), "ctx") is None
+
+
+@pytest.mark.asyncio
+async def test_call_llm_misses_once_context_moves_on():
+    agent = make_agent(FakeCache())
+    context = [SystemMessage(content="prompt"), UserMessage(content="hi")]
+
+    first = await agent.call_llm(context=context)
+    again = await agent.call_llm(context=list(context))
+    assert again.content == first.content
+    assert agent.llm.calls == 1
+
+    # same user text, but a tool result arrived in between
+    with_tool = [*context, ToolMessage(content="result")]
+    assert (await agent.call_llm(context=with_tool)).content != first.content
+    assert agent.llm.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_call_llm_never_caches_structured_calls():
+    cache = FakeCache()
+    agent = make_agent(cache)
+    context = [UserMessage(content="hi")]
+    schema = {"type": "json_schema"}
+
+    await agent.call_llm(context=context, json_schema=schema)
+    await agent.call_llm(context=context, json_schema=schema)
+
+    assert agent.llm.calls == 2
+    assert not cache.entries
@@ -0,0 +1,79 @@
+import orjson
+import pytest
+
+from agent_module.agent import Agent
+from model_module.ArkModelNew import SystemMessage, UserMessage
+from state_module.state_ai import StateAI
+
+
+class AskUser:
+    name = "ask_user"
+    is_terminal = True
+
+
+class FakeFlow:
+    def __init__(self):
+        reply = StateAI("agent_reply", {})
+        # filled in by StateHandler in the real graph
+        reply.next_state_schema_envelope = {"type": "json_schema"}
+        self.states = {"agent_reply": reply, "ask_user": AskUser()}
+
+    def get_initial_state(self):
+        return self.states["agent_reply"]
+
+    def get_state(self, name):
+        return self.states[name]
+
+    def get_transitions(self, state, messages):
+        return {"tt": ["agent_reply", "ask_user"]}
+
+
+class FakeMemory:
+    def __init__(self):
+        self.rows = []
+
+    async def add_memories_async(self, messages):
+        self.rows.extend(messages)
+        return True
+
+    async def retrieve_short_memory_async(self, turns):
+        return self.rows[-turns:]
+
+    async def retrieve_long_memory_async(self, query, limit=50, exclude_recent=0):
+        return SystemMessage(content="Relevant memories:\n")
+
+
+class FakeLLM:
+    """Replies twice in a row before handing the turn back to the user."""
+
+    def __init__(self):
+        self.replies = 0
+        self.transitions = iter(["agent_reply", "ask_user"])
+
+    async def generate_response(self, context, json_schema=None):
+        if json_schema is not None:
+            return orjson.dumps({"next_state": next(self.transitions)}).decode()
+        self.replies += 1
+        return f"reply {self.replies}"
+
+    async def generate_response_stream(self, context):
+        self.replies += 1
+        for delta in ("reply", " ", str(self.replies)):
+            yield delta
+
+
+def make_agent():
+    return Agent(agent_id="test", flow=FakeFlow(), memory=FakeMemory(), llm=FakeLLM())
+
+
+@pytest.mark.asyncio
+async def test_stream_sends_only_the_final_reply():
+    expected = await make_agent().step([UserMessage(content="hi")])
+
+    text = ""
+    async for event in make_agent().step_stream([UserMessage(content="hi")]):
+        if event != "data: [DONE]\n\n":
+            delta = orjson.loads(event[len("data: "):])["choices"][0]["delta"]
+            text += delta.get("content", "")
+
+    assert text == expected.content == "reply 2"
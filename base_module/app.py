@@ -1,29 +1,36 @@
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+import httpx
+import orjson
 import uvicorn
+import logging
+import sys
 import time
 import uuid
-import os
-import sys
-
-# Standard boilerplate for module imports
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from contextlib import asynccontextmanager
 from tool_module.tool_call import MCPToolManager
+from tool_module.discovery_cache import discovery_cache
 from config_module.loader import config
 from agent_module.agent import Agent
 from state_module.state_handler import StateHandler
+from state_module.mcp_pool import shutdown_managers
 from memory_module.memory import Memory
 from model_module.ArkModelNew import ArkModelLink, UserMessage, SystemMessage, AIMessage
 
 
+logging.basicConfig(level=config.get("app.log_level", "WARNING"))
+
+
 tool_manager = None
 flow = None
 memory = None
 llm = None
 agent = None
 
+# shared across /health calls so the connection pool is reused
+http_client = httpx.AsyncClient()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -38,20 +45,43 @@ async def lifespan(app: FastAPI):
         user_id=config.get("memory.user_id"),
         session_id=None,
         db_url=config.get("database.url"),
+        pool_min=int(config.get("database.pool_min", 1)),
+        pool_max=int(config.get("database.pool_max", 10)),
+        embed_url=config.get("memory.embed_url"),
+        embed_model=config.get("memory.embed_model"),
     )
-    llm = ArkModelLink(base_url=config.get("llm.base_url"))
+    llm = ArkModelLink(
+        base_url=config.get("llm.base_url"),
+        max_connections=int(config.get("llm.max_concurrency")),
+    )
+
+    semantic_cache = None
+    if config.get("semantic_cache.enabled"):
+        # imported lazily, sentence-transformers is heavy to load
+        from agent_module.semantic_cache import SemanticCache
+
+        semantic_cache = SemanticCache(
+            model_name=config.get("semantic_cache.model_name"),
+            threshold=float(config.get("semantic_cache.threshold")),
+            max_entries=int(config.get("semantic_cache.max_entries")),
+        )
+
     agent = Agent(
         agent_id=config.get("memory.user_id"),
         flow=flow,
         memory=memory,
         llm=llm,
         tool_manager=None,
+        semantic_cache=semantic_cache,
+        system_prompt=config.get("app.system_prompt"),
+        llm_concurrency=int(config.get("llm.max_concurrency")),
     )
 
     # Initialize MCP servers (async)
     mcp_config = config.get("mcp_servers")
     if mcp_config:
-        tool_manager = MCPToolManager(mcp_config)
+        # servers with a cached tool catalog start on their first tool call
+        tool_manager = MCPToolManager(mcp_config, discovery_cache=discovery_cache)
         await tool_manager.initialize_servers()
         agent.tool_manager = tool_manager
         print(f"Initialized {len(tool_manager.clients)} MCP servers")
@@ -67,9 +97,26 @@ async def lifespan(app: FastAPI):
     if tool_manager:
         await tool_manager.shutdown()
         print("MCP servers shut down")
+    await shutdown_managers()
+
+    await llm.aclose()
+    memory.close()
+    await http_client.aclose()
+
 
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson; fastapi.responses.ORJSONResponse is deprecated."""
 
-app = FastAPI(title="ArkOS Agent API", version="1.0.0", lifespan=lifespan)
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+app = FastAPI(
+    title="ArkOS Agent API",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 # Default system prompt for the agent
 SYSTEM_PROMPT = """THIS IS A NEW CONVERSATION (past converation info is above)
 
@@ -86,15 +133,14 @@ Always stay in character as ARK when responding."""
 @app.get("/health")
 async def health_check():
     """Health check endpoint to verify server and dependencies."""
-    import requests
     llm_status = "unknown"
     try:
-        response = requests.get("http://localhost:30000/v1/models", timeout=2)
+        response = await http_client.get(f"{config.get('llm.base_url')}/models", timeout=2)
         llm_status = "running" if response.status_code == 200 else "error"
-    except:
+    except httpx.RequestError:
         llm_status = "not_running"
     
-    return JSONResponse(content={
+    return ORJSONResponse(content={
         "status": "ok",
         "llm_server": llm_status,
         "port": 1111
@@ -104,17 +150,16 @@ async def health_check():
 @app.post("/v1/chat/completions")
 async def chat_completions(request: Request):
     """OAI-compatible endpoint wrapping the full ArkOS agent."""
-    # Awaiting request.json() is correct for FastAPI's async handling of the request body
-    payload = await request.json()
+    payload = orjson.loads(await request.body())
 
     messages = payload.get("messages", [])
     model = payload.get("model", "ark-agent")
     response_format = payload.get("response_format")
 
+    # the system prompt is owned by the agent (see Agent.get_context), so it is
+    # not prepended per request
     context_msgs = []
 
-    context_msgs.append(SystemMessage(content=config.get("app.system_prompt")))                            
-
     # Convert OAI messages into internal message objects
     for msg in messages:
         role = msg["role"]
@@ -136,6 +181,12 @@ async def chat_completions(request: Request):
         # tool_calls and tool_messages if your agent uses them heavily.
 
 
+    if payload.get("stream"):
+        return StreamingResponse(
+            agent.step_stream(context_msgs, model=model),
+            media_type="text/event-stream",
+        )
+
     # *** THE CRITICAL CHANGE: AWAIT the agent's step method ***
     # This prevents the 'coroutine' object has no attribute 'content' error.
     agent_response = await agent.step(context_msgs)
@@ -160,7 +211,7 @@ async def chat_completions(request: Request):
         ],
     }
 
-    return JSONResponse(content=completion)
+    return ORJSONResponse(content=completion)
 
 
 if __name__ == "__main__":
@@ -170,4 +221,7 @@ if __name__ == "__main__":
         host=config.get("app.host"),
         port=int(config.get("app.port")),
         reload=config.get("app.reload"),
+        # uvloop is a requirement everywhere but Windows; MCP stdio and LLM
+        # HTTP round trips all run on this loop
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
     )
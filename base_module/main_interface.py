@@ -1,21 +1,24 @@
-
-import os, sys
+import httpx
 from openai import OpenAI
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from config_module.loader import config
 
 
 # Point to your running ArkOS agent
+# one keep-alive connection is reused for every turn of the REPL; HTTP/1.1 on
+# purpose, uvicorn does not serve HTTP/2 and httpx only negotiates it over TLS
 client = OpenAI(
     base_url=f"http://localhost:{config.get('app.port')}/v1",
-    api_key="not-needed"
+    api_key="not-needed",
+    http_client=httpx.Client(limits=httpx.Limits(max_keepalive_connections=10)),
 )
 
+# reused across turns, only the content is replaced
+messages = [{"role": "user", "content": ""}]
+
 
 def test_agent(prompt: str):
-    response = client.chat.completions.create(
-        model="ark-agent", messages=[{"role": "user", "content": prompt}]
-    )
+    messages[-1]["content"] = prompt
+    response = client.chat.completions.create(model="ark-agent", messages=messages)
 
     message = response.choices[0].message.content
     print("=== Agent Response ===")
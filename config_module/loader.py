@@ -1,10 +1,22 @@
 import os
 import re
+import tempfile
+import orjson
 import yaml
 from pathlib import Path
 from typing import Any, Dict, Optional
 from dotenv import load_dotenv
 
+# libyaml's C parser when PyYAML was built with it, pure Python otherwise
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+
+# Matches ${VAR} patterns in config string values
+_ENV_VAR_RE = re.compile(r"\$\{([^}]+)\}")
+
 
 class ConfigLoader:
     """
@@ -31,6 +43,12 @@ class ConfigLoader:
         self.config_path = Path(config_path)
         self._config: Optional[Dict[str, Any]] = None
 
+        # dot-path -> value for every node of the loaded config
+        self._flat: Dict[str, Any] = {}
+
+        # VAR -> value, resolved once per load()
+        self._env_cache: Dict[str, str] = {}
+
         # Check if config file exists
         if not self.config_path.exists():
             raise FileNotFoundError(
@@ -50,13 +68,82 @@ class ConfigLoader:
             return self._config
 
         # Load YAML
-        with open(self.config_path, "r") as f:
-            config = yaml.safe_load(f)
+        config = self._parse_yaml()
 
         # Substitute environment variables
+        self._env_cache = {}
         self._config = self._substitute_env_vars(config)
+        self._flat = {}
+        if isinstance(self._config, dict):
+            self._flatten(self._config, "", self._flat)
         return self._config
 
+    def _parse_yaml(self) -> Any:
+        """
+        Parse the YAML file, reusing a JSON side-file when it is still fresh.
+
+        The cache holds the parsed tree *before* env var substitution, so no
+        secrets are written to disk and env changes still apply on every load.
+        It is keyed on the YAML file's mtime and size. Documents that do not
+        survive a JSON round trip unchanged (dates, non-string keys) are not
+        cached.
+
+        Returns:
+            Parsed YAML document
+        """
+        stat = self.config_path.stat()
+        sig = [stat.st_mtime_ns, stat.st_size]
+        cache_path = self.config_path.with_suffix(".cache")
+
+        try:
+            cached = orjson.loads(cache_path.read_bytes())
+            if isinstance(cached, dict) and cached.get("sig") == sig and "config" in cached:
+                return cached["config"]
+        except (OSError, orjson.JSONDecodeError):
+            pass
+
+        with open(self.config_path, "r") as f:
+            config = yaml.load(f, Loader=_Loader)
+
+        try:
+            data = orjson.dumps({"sig": sig, "config": config})
+        except TypeError:
+            return config
+        if orjson.loads(data)["config"] != config:
+            return config
+
+        # best effort, write atomically so concurrent workers never read a partial file
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        except OSError:
+            return config
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+        return config
+
+    def _flatten(self, obj: Dict[str, Any], prefix: str, out: Dict[str, Any]) -> None:
+        """
+        Record every node of a nested config under its dot-path.
+
+        Args:
+            obj: Config dict to walk
+            prefix: Dot-path of obj ("" for the root)
+            out: Dict the dot-path entries are written to
+        """
+        for key, val in obj.items():
+            path = f"{prefix}.{key}" if prefix else str(key)
+            out[path] = val
+            if isinstance(val, dict):
+                self._flatten(val, path, out)
+
     def _substitute_env_vars(self, obj: Any) -> Any:
         """
         Recursively substitute ${VAR} patterns with os.environ['VAR'].
@@ -65,35 +152,55 @@ class ConfigLoader:
             obj: Config value (dict, list, str, etc.)
 
         Returns:
-            Same structure with variables substituted
+            Same structure with variables substituted. Containers without any
+            ${VAR} below them are returned as-is rather than copied.
         """
         if isinstance(obj, dict):
-            return {key: self._substitute_env_vars(val) for key, val in obj.items()}
+            out = None
+            for key, val in obj.items():
+                new_val = self._substitute_env_vars(val)
+                if new_val is not val:
+                    if out is None:
+                        out = dict(obj)
+                    out[key] = new_val
+            return obj if out is None else out
 
         elif isinstance(obj, list):
-            return [self._substitute_env_vars(item) for item in obj]
+            out = None
+            for i, item in enumerate(obj):
+                new_item = self._substitute_env_vars(item)
+                if new_item is not item:
+                    if out is None:
+                        out = list(obj)
+                    out[i] = new_item
+            return obj if out is None else out
 
         elif isinstance(obj, str):
-            # Match ${VAR} pattern
-            pattern = r"\$\{([^}]+)\}"
+            if "${" not in obj:
+                return obj
+            return _ENV_VAR_RE.sub(self._replace_env, obj)
 
-            def replace_var(match):
-                var_name = match.group(1)
-                var_value = os.environ.get(var_name)
+        else:
+            return obj
 
-                if var_value is None:
-                    raise EnvironmentError(
-                        f"Environment variable '{var_name}' not found.\n"
-                        f"Required by: {self.config_path}\n"
-                        f"Please set it in .env file or export it."
-                    )
+    def _replace_env(self, match: re.Match) -> str:
+        """Resolve a single ${VAR} match from os.environ."""
+        var_name = match.group(1)
+        var_value = self._env_cache.get(var_name)
+        if var_value is not None:
+            return var_value
 
-                return var_value
+        var_value = os.environ.get(var_name)
 
-            return re.sub(pattern, replace_var, obj)
+        if var_value is None:
+            raise EnvironmentError(
+                f"Environment variable '{var_name}' not found.\n"
+                f"Required by: {self.config_path}\n"
+                f"Please set it in .env file or export it."
+            )
 
-        else:
-            return obj
+        self._env_cache[var_name] = var_value
+        return var_value
 
     def get(self, key_path: str, default: Any = None) -> Any:
         """
@@ -114,19 +221,10 @@ class ConfigLoader:
             >>> config.get('nonexistent.key', default=999)
             999
         """
-        config = self.load()
-        keys = key_path.split(".")
-        value = config
+        self.load()
+        value = self._flat.get(key_path)
 
-        for key in keys:
-            if isinstance(value, dict):
-                value = value.get(key)
-                if value is None:
-                    return default
-            else:
-                return default
-
-        return value
+        return default if value is None else value
 
     def reload(self) -> Dict[str, Any]:
         """Force reload config from disk (useful for testing)."""
@@ -135,11 +233,22 @@ class ConfigLoader:
 
 
 # Find project root and load .env
-project_root = Path(__file__).parent.parent
-env_path = project_root / ".env"
+ENV_PATH = Path(__file__).parent.parent / ".env"
+
+
+def load_env() -> None:
+    """
+    Load the project .env file once per process tree.
+
+    Workers and reloads inherit the environment of the process that already
+    loaded it, so later calls are no-ops.
+    """
+    if ENV_PATH.exists() and not os.environ.get("_ARKOS_DOTENV_LOADED"):
+        load_dotenv(dotenv_path=ENV_PATH, override=False)
+        os.environ["_ARKOS_DOTENV_LOADED"] = "1"
+
 
-# Load .env file - python-dotenv handles everything
-load_dotenv(dotenv_path=env_path, override=False)
+load_env()
 
 # Create global config instance
 config = ConfigLoader()
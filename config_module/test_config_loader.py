@@ -63,6 +63,8 @@ test:
         
     finally:
         os.unlink(temp_config_path)
+        # the loader leaves its parse cache next to the YAML file
+        Path(temp_config_path).with_suffix(".cache").unlink(missing_ok=True)
 
 
 def test_nested_config_access():
@@ -124,6 +126,31 @@ def test_existing_config_values():
         print(f"  [OK] database.url configured")
 
 
+def test_parse_cache():
+    """Test that the parsed YAML side-file is reused and a corrupt one ignored"""
+    print("\n[OK] Testing parse cache...")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = Path(tmp) / "config.yaml"
+        config_path.write_text("app:\n  port: 1111\n")
+        cache_path = config_path.with_suffix(".cache")
+
+        assert ConfigLoader(str(config_path)).get("app.port") == 1111
+        assert cache_path.exists(), "Parse cache should be written"
+        print("  [OK] Parse cache written")
+
+        cache_path.write_bytes(b"\x80 not json")
+        assert ConfigLoader(str(config_path)).get("app.port") == 1111, \
+            "Corrupt cache should fall back to the YAML file"
+        print("  [OK] Corrupt cache ignored")
+
+        # a stale signature must not be trusted
+        cache_path.write_bytes(b'{"sig": [0, 0], "config": {"app": {"port": 1}}}')
+        assert ConfigLoader(str(config_path)).get("app.port") == 1111, \
+            "Stale cache should be reparsed"
+        print("  [OK] Stale cache reparsed")
+
+
 def main():
     """Run all tests"""
     print("=" * 60)
@@ -136,6 +163,7 @@ def main():
         test_nested_config_access()
         test_default_values()
         test_existing_config_values()
+        test_parse_cache()
         
         print("\n" + "=" * 60)
         print("[PASS] All tests passed!")
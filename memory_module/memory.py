@@ -1,14 +1,17 @@
 # memory.py
+import asyncio
 import os
 import uuid
-import sys
-import psycopg2
-from typing import Dict, Any
-from mem0 import Memory as Mem0Memory
-from dotenv import load_dotenv
+import traceback
+import threading
+from contextlib import contextmanager
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import httpx
+import orjson
+from typing import Dict, Any, List
 
+
+from config_module.loader import load_env
 from model_module.ArkModelNew import (
     Message,
     UserMessage,
@@ -36,52 +39,94 @@ CLASS_TO_ROLE: Dict[Type[Message], str] = {
 }
 
 
-# Global Mem0 config ---------------------
 # Load .env file
-load_dotenv()
-os.environ["OPENAI_API_KEY"] = "sk"
-
-config = {
-    "vector_store": {
-        "provider": "supabase",
-        "config": {
-            "connection_string": os.environ["DB_URL"],
-            "collection_name": "memories",
-            "index_method": "hnsw",
-            "index_measure": "cosine_distance",
-        },
-    },
-    "llm": {
-        "provider": "vllm",
-        "config": {
-            "model": "Qwen/Qwen2.5-7B-Instruct",
-            "vllm_base_url": "http://localhost:30000/v1",
-        },
-    },
-    "embedder": {
-        "provider": "huggingface",
-        "config": {"huggingface_base_url": "http://localhost:4444/v1"},
-    },
-}
+load_env()
 
 
 class Memory:
     """
-    Connects agent to supabase backend for long
+    Connects agent to the Postgres backend for long
     and short term memories
 
+    Every turn is written once to conversation_context together with its
+    embedding. Short term memory is the latest rows by id, long term memory
+    is a pgvector similarity search over the same table.
     """
 
-    def __init__(self, user_id: str, session_id: str, db_url: str):
+    def __init__(
+        self,
+        user_id: str,
+        session_id: str,
+        db_url: str,
+        pool_min: int = 1,
+        pool_max: int = 10,
+        embed_url: str = "http://localhost:4444/v1",
+        embed_model: str = "default",
+    ):
         self.user_id = user_id
         self.db_url = db_url
 
-        # initialize mem0
-        self.mem0 = Mem0Memory.from_config(config)
+        # shared by the worker threads of the *_async methods, so each
+        # insert/select reuses an open connection instead of a fresh handshake
+        # psycopg2 is imported on first use, see _connection and _insert_rows
+        from psycopg2.pool import ThreadedConnectionPool
+
+        self._pool = ThreadedConnectionPool(pool_min, pool_max, db_url)
+        # getconn raises once the pool is exhausted, wait for a free slot instead
+        self._pool_slots = threading.BoundedSemaphore(pool_max)
+
+        # OpenAI-compatible embeddings endpoint (TEI), one request per batch
+        self.embed_url = embed_url.rstrip("/") + "/embeddings"
+        self.embed_model = embed_model
+        self._embed_client = httpx.Client(timeout=30)
 
         # session handling
         self.session_id = session_id if session_id is not None else str(uuid.uuid4())
 
+    @contextmanager
+    def _connection(self):
+        """
+        Borrow a pooled connection, rolled back on error and returned after use.
+        Connections that were closed by the server, or broke while in use, are
+        discarded rather than handed to the next caller.
+        """
+        import psycopg2
+
+        with self._pool_slots:
+            conn = self._pool.getconn()
+            if conn.closed:
+                self._pool.putconn(conn, close=True)
+                conn = self._pool.getconn()
+
+            discard = False
+            try:
+                yield conn
+            except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                discard = True
+                raise
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                self._pool.putconn(conn, close=discard or bool(conn.closed))
+
+    def close(self):
+        """Close all pooled database connections and the embeddings client."""
+        self._pool.closeall()
+        self._embed_client.close()
+
+    def embed(self, texts: List[str]) -> List[str]:
+        """
+        Embed texts with one call to the embeddings endpoint.
+        Returns pgvector literals ("[0.1,0.2,...]") in input order.
+        """
+        response = self._embed_client.post(
+            self.embed_url, json={"input": texts, "model": self.embed_model}
+        )
+        response.raise_for_status()
+        data = sorted(response.json()["data"], key=lambda d: d["index"])
+        return [orjson.dumps(d["embedding"]).decode() for d in data]
+
     def start_new_session(self):
         """Start a new chat session."""
         self.session_id = str(uuid.uuid4())
@@ -105,74 +150,114 @@ class Memory:
         return cls.model_validate_json(message)
 
     def add_memory(self, message) -> bool:
-        """Add a single turn to Mem0 + Postgres."""
-        try:
-            role = CLASS_TO_ROLE[type(message)]
-
-            metadata = {
-                "user_id": self.user_id,
-                "session_id": self.session_id,
-                "role": role,
-            }
-
-            # store in mem0
-            self.mem0.add(
-                messages=message.content, metadata=metadata, user_id=self.user_id
-            )
-
-            conn = psycopg2.connect(self.db_url)
-            cur = conn.cursor()
-            cur.execute(
-                """
-                INSERT INTO conversation_context (user_id, session_id, role, message)
-                VALUES (%s, %s, %s, %s)
-                """,
-                (self.user_id, self.session_id, role, self.serialize(message)),
-            )
-            conn.commit()
-            cur.close()
-            conn.close()
+        """Add a single turn to Postgres."""
+        return self.add_memories([message])
 
+    def add_memories(self, messages: list) -> bool:
+        """Add several turns to Postgres in a single database round trip."""
+        try:
+            self._insert_rows(messages)
             return True
 
         except Exception as e:
-            import traceback
-
             traceback.print_exc()
             raise
             print(e)
             return False
 
+    def _insert_rows(self, messages: list):
+        """Embed turns and insert them into conversation_context with one statement."""
+        if not messages:
+            return
+
+        from psycopg2.extras import execute_values
+
+        embeddings = self.embed([m.content or "" for m in messages])
+        rows = [
+            (
+                self.user_id,
+                self.session_id,
+                CLASS_TO_ROLE[type(m)],
+                self.serialize(m),
+                embedding,
+            )
+            for m, embedding in zip(messages, embeddings)
+        ]
+
+        with self._connection() as conn:
+            with conn.cursor() as cur:
+                execute_values(
+                    cur,
+                    """
+                    INSERT INTO conversation_context
+                        (user_id, session_id, role, message, embedding)
+                    VALUES %s
+                    """,
+                    rows,
+                    template="(%s, %s, %s, %s, %s::vector)",
+                )
+            conn.commit()
+
     def retrieve_long_memory(
-        self, context: list = [], mem0_limit: int = 50
+        self, context: list = [], limit: int = 50, query: str = None, exclude_recent: int = 0
     ) -> Dict[str, Any]:
-        """Retrieve relevant long term memories for the current user."""
+        """
+        Retrieve relevant long term memories for the current user.
+        The search query is built from context unless query is given.
+        The newest exclude_recent rows are skipped, they are already in the
+        short term window (and include the query turn itself).
+        """
         try:
-            # Mem0 vector retrieval
-
-            query = ""
-
-            for message in context:
-                query += f" \n {message.content}"
-
-            results = self.mem0.search(
-                query=query,
-                user_id=self.user_id,
-                limit=mem0_limit,
+            if query is None:
+                query = ""
+
+                for message in context:
+                    query += f" \n {message.content}"
+
+            (query_embedding,) = self.embed([query])
+
+            recent_filter = ""
+            params = [self.user_id]
+            if exclude_recent > 0:
+                recent_filter = """
+                    AND id < (
+                        SELECT min(id) FROM (
+                            SELECT id FROM conversation_context
+                            WHERE user_id = %s
+                            ORDER BY id DESC
+                            LIMIT %s
+                        ) recent
+                    )"""
+                params += [self.user_id, exclude_recent]
+            params += [query_embedding, limit]
+
+            # served by the hnsw (embedding vector_cosine_ops) index
+            with self._connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        f"""
+                    SELECT role, message
+                    FROM conversation_context
+                    WHERE user_id = %s AND embedding IS NOT NULL{recent_filter}
+                    ORDER BY embedding <=> %s::vector, id
+                    LIMIT %s
+                    """,
+                        params,
+                    )
+
+                    rows = cur.fetchall()
+                # end the read transaction before the connection goes back
+                conn.rollback()
+
+            # rendered straight into the join without an intermediate list of lines
+            memory_string = "Relevant memories:\n" + "\n".join(
+                f"{role}: {self.deserialize(message=msg, role=role).content}"
+                for role, msg in rows
             )
 
-            memory_entries = [
-                f"{r.get('role', 'user')}: {r['memory']}"
-                for r in results.get("results", [])
-            ]
-
-            memory_string = "retrieved memories:\n" + "\n".join(memory_entries)
-
             return SystemMessage(content=memory_string)
 
         except Exception:
-            import traceback
-
             traceback.print_exc()
             raise
 
@@ -181,33 +266,49 @@ class Memory:
     def retrieve_short_memory(self, turns):
         """Retrieve relevant short term memories for the current user"""
         try:
-            conn = psycopg2.connect(self.db_url)
-            cur = conn.cursor()
-            cur.execute(
-                """
-            SELECT role, message
-            FROM (
-                SELECT id, role, message
-                FROM conversation_context
-                WHERE user_id = %s
-                ORDER BY id DESC
-                LIMIT %s
-            ) sub
-            ORDER BY id ASC
-            """,
-                (self.user_id, turns),
-            )
-
-            rows = cur.fetchall()
-            cur.close()
-            conn.close()
-
-            return [self.deserialize(message=msg, role=role) for role, msg in rows]
+            with self._connection() as conn:
+                with conn.cursor() as cur:
+                    # newest first so an index on (user_id, id DESC) is read
+                    # front to back and stops after `turns` rows
+                    cur.execute(
+                        """
+                    SELECT role, message
+                    FROM conversation_context
+                    WHERE user_id = %s
+                    ORDER BY id DESC
+                    LIMIT %s
+                    """,
+                        (self.user_id, turns),
+                    )
+
+                    rows = cur.fetchall()
+                # end the read transaction before the connection goes back
+                conn.rollback()
+
+            return [
+                self.deserialize(message=msg, role=role) for role, msg in reversed(rows)
+            ]
 
         except Exception as e:
             print(e)
             return []
 
+    async def add_memories_async(self, messages: list) -> bool:
+        """Non-blocking add_memories, runs in a worker thread."""
+        return await asyncio.to_thread(self.add_memories, messages)
+
+    async def retrieve_short_memory_async(self, turns):
+        """Non-blocking retrieve_short_memory, runs in a worker thread."""
+        return await asyncio.to_thread(self.retrieve_short_memory, turns)
+
+    async def retrieve_long_memory_async(
+        self, query: str, limit: int = 50, exclude_recent: int = 0
+    ):
+        """Non-blocking retrieve_long_memory for a single query string."""
+        return await asyncio.to_thread(
+            self.retrieve_long_memory, query=query, limit=limit, exclude_recent=exclude_recent
+        )
+
 
 if __name__ == "__main__":
     test_instance = Memory(
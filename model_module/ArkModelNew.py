@@ -1,13 +1,11 @@
 
 
 
-import json
 import pprint
 from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field
-# Import the asynchronous client
-from openai import AsyncOpenAI
+import httpx
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 # --- Custom Message Classes ---
@@ -51,6 +49,22 @@ class AIMessage(Message):
     tool_calls: Optional[dict] = None
 
 
+# Message class -> OpenAI chat payload entry
+_SERIALIZERS = {
+    UserMessage: lambda m: {"role": "user", "content": m.content},
+    SystemMessage: lambda m: {"role": "system", "content": m.content},
+    # Note: ToolMessage in OpenAI API usually requires 'tool_call_id'
+    # and 'name' if it's a ToolMessage response, but this format
+    # (role='tool', content=...) is often used for simple outputs.
+    ToolMessage: lambda m: {"role": "tool", "content": m.content},
+    # Always include 'content' key for assistant messages.
+    AIMessage: lambda m: {
+        "role": "assistant",
+        "content": m.content if m.content is not None else "",
+    },
+}
+
+
 class ArkModelLink(BaseModel):
     """
     A custom chat model designed to interface with Hugging Face TGI
@@ -63,23 +77,53 @@ class ArkModelLink(BaseModel):
     base_url: str = Field(default="http://0.0.0.0:30000/v1")
     max_tokens: int = Field(default=1024)
     temperature: float = Field(default=0.7)
-
-    # Use a property or method to initialize the client asynchronously if needed,
-    # or just create it in the async method, as AsyncOpenAI handles the session.
-    
-    # We'll use a property for a lazy, non-async instantiation of the client wrapper.
-    # The actual network calls will be awaited inside the method.
-    @property
-    def client(self) -> AsyncOpenAI:
-        """Returns the configured AsyncOpenAI client."""
-        return AsyncOpenAI(
+    # size of the HTTP connection pool, match the concurrent slots of the backend
+    max_connections: int = Field(default=8)
+
+    _http_client: httpx.AsyncClient = PrivateAttr(default=None)
+    # AsyncOpenAI, imported in model_post_init so modules that only need the
+    # Message classes do not load the openai package
+    _client: Any = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Creates the pooled HTTP client and the OpenAI client shared by every LLM call."""
+        # Import the asynchronous client
+        from openai import AsyncOpenAI
+
+        self._http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            )
+        )
+        self._client = AsyncOpenAI(
             base_url=self.base_url,
             api_key="-", # Placeholder/Dummy API key
+            http_client=self._http_client,
         )
 
+    async def aclose(self) -> None:
+        """Closes the shared client and its connection pool."""
+        await self._client.close()
+
+    def build_payload(self, messages: List[Message]) -> List[Dict[str, Any]]:
+        """
+        Converts custom Message objects into the format expected by the OpenAI API.
+        The result can be passed back to make_llm_call as payload, so retries
+        over the same history skip the conversion.
+        """
+        try:
+            return [_SERIALIZERS[type(msg)](msg) for msg in messages]
+        except KeyError as e:
+            raise ValueError(f"Unsupported Message Type ArkModel.py: {e}") from None
 
     async def make_llm_call(
-        self, messages: List[Message], json_schema: Optional, stream=False
+        self,
+        messages: List[Message],
+        json_schema: Optional,
+        stream=False,
+        *,
+        payload: Optional[List[Dict[str, Any]]] = None,
     ) -> Union[Dict[str, Any], str]:
         """
         Makes an ASYNCHRONOUS call to the OpenAI-compatible LLM endpoint.
@@ -87,49 +131,24 @@ class ArkModelLink(BaseModel):
         Args:
             messages: A list of custom Message objects representing the conversation history.
             json_schema: An optional schema to expose to the LLM.
+            payload: Output of build_payload(messages), reused instead of converting again.
 
         Returns:
-            The content of the LLM's text response (str) or a detailed dict if streaming.
+            The content of the LLM's text response (str), or an async iterator
+            over the content deltas (str) if streaming.
         """
         
-        # Convert custom Message objects into the format expected by the OpenAI API.
-        openai_messages_payload = []
-        for msg in messages:
-            if isinstance(msg, UserMessage):
-                openai_messages_payload.append({"role": "user", "content": msg.content})
-
-            elif isinstance(msg, SystemMessage):
-                openai_messages_payload.append(
-                    {"role": "system", "content": msg.content}
-                )
-
-            elif isinstance(msg, ToolMessage):
-                # Note: ToolMessage in OpenAI API usually requires 'tool_call_id' 
-                # and 'name' if it's a ToolMessage response, but this format 
-                # (role='tool', content=...) is often used for simple outputs.
-                openai_messages_payload.append(
-                    {"role": "tool", "content": msg.content}
-                )
-
-
-            elif isinstance(msg, AIMessage):
-                msg_dict = {"role": "assistant"}
-                # Always include 'content' key for assistant messages.
-                msg_dict["content"] = msg.content if msg.content is not None else ""
-                openai_messages_payload.append(msg_dict)
-            else:
-                print(type(msg))
-                print(msg)
-                raise ValueError("Unsupported Message Type ArkModel.py")
+        openai_messages_payload = (
+            payload if payload is not None else self.build_payload(messages)
+        )
 
         try:
             if stream:
-                # The stream logic for an async generator is complex and omitted here
-                # but if implemented, it would use client.chat.completions.create(..., stream=True)
-                raise NotImplementedError("Asynchronous streaming not yet implemented.")
+                # errors surface while iterating, see _stream_deltas
+                return self._stream_deltas(openai_messages_payload, json_schema)
             
             # Use the asynchronous client and AWAIT the call
-            chat_completion = await self.client.chat.completions.create(
+            chat_completion = await self._client.chat.completions.create(
                 model=self.model_name,
                 messages=openai_messages_payload,
                 max_tokens=self.max_tokens,
@@ -149,6 +168,42 @@ class ArkModelLink(BaseModel):
             return f"Error: An error occurred during async LLM call: {e}"
 
 
+    async def _stream_deltas(
+        self, openai_messages_payload: List[Dict[str, Any]], json_schema
+    ) -> AsyncIterator[str]:
+        """Yields content deltas from a streamed chat completion."""
+        try:
+            completion_stream = await self._client.chat.completions.create(
+                model=self.model_name,
+                messages=openai_messages_payload,
+                max_tokens=self.max_tokens,
+                temperature=self.temperature,
+                response_format=json_schema,
+                stream=True,
+            )
+
+            async for chunk in completion_stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        except Exception as e:
+            print(f"Error during async LLM stream: {e}")
+            yield f"Error: An error occurred during async LLM stream: {e}"
+
+    async def generate_response_stream(
+        self, messages: List[Message], json_schema=None
+    ) -> AsyncIterator[str]:
+        """
+        ASYNCHRONOUSLY streams a response from the model.
+
+        Yields content deltas as the model produces them, so the first
+        token reaches the caller after prefill rather than full decode.
+        """
+        deltas = await self.make_llm_call(messages, json_schema=json_schema, stream=True)
+
+        async for delta in deltas:
+            yield delta
+
     async def generate_response(self, messages: List[Message], json_schema) -> str:
         """
         ASYNCHRONOUSLY Generates a response from the model.
@@ -0,0 +1,70 @@
+"""
+Process-wide pool of MCPToolManager instances shared by the tool states.
+
+Starting an MCP server spawns a subprocess and runs the stdio handshake,
+so each manager is created once per key and reused by every run. Servers
+are registered lazily and only started by the first tool call that needs them.
+"""
+
+import logging
+import os
+from typing import Any, Dict
+
+from tool_module.discovery_cache import discovery_cache
+from tool_module.tool_call import MCPToolManager
+
+logger = logging.getLogger(__name__)
+
+_managers: Dict[str, MCPToolManager] = {}
+
+
+def passthrough_env(*names: str) -> Dict[str, str]:
+    """
+    Pick the named variables out of os.environ for a server config's env.
+
+    Servers get only what they need instead of the whole environment, which
+    also keeps their DiscoveryCache key stable across shells and sessions.
+    Unset names are skipped.
+    """
+    return {name: os.environ[name] for name in names if name in os.environ}
+
+
+def get_manager(key: str, config: Dict[str, Dict[str, Any]]) -> MCPToolManager:
+    """
+    Return the manager for key, creating it on first use.
+
+    Creating a manager only registers its servers and never awaits, so two
+    callers on the event loop cannot race here.
+
+    Parameters
+    ----------
+    key : str
+        Pool key, usually the MCP server name
+    config : Dict[str, Dict[str, Any]]
+        MCP servers configuration, only used when the manager is created
+
+    Returns
+    -------
+    MCPToolManager
+        Manager with its servers registered; each starts on the first tool
+        call that needs it
+    """
+    manager = _managers.get(key)
+    if manager is None:
+        manager = MCPToolManager(config, discovery_cache=discovery_cache)
+        manager.register_servers()
+        _managers[key] = manager
+
+    return manager
+
+
+async def shutdown_managers() -> None:
+    """Shut down every pooled manager and empty the pool."""
+    managers = list(_managers.values())
+    _managers.clear()
+
+    for manager in managers:
+        try:
+            await manager.shutdown()
+        except Exception as e:
+            logger.error("Error shutting down MCP manager: %s", e)
@@ -14,9 +14,16 @@ class AgentState(Enum):
 class State:
     def __init__(self, name: str, config: Dict[str, Any]):
         self.name = name
+        self.description: Optional[str] = config.get("description")
         self.is_terminal: bool = False
         self.transition = config.get("transition", {})
 
+        # filled in by StateHandler once the whole graph is loaded
+        self.num_transitions: int = 0
+        self.static_next: Optional[str] = None
+        self.transition_prompt: str = ""
+        self.next_state_schema_envelope: Optional[Dict[str, Any]] = None
+
     def check_transition_ready(self, context: Dict[str, Any]) -> bool:
         """
         USER DEFINED STATES SHOULD OVERRRIDE THIS FUNCTION
@@ -28,3 +35,4 @@ class State:
         USER DEFINED STATES SHOULD OVERRRIDE THIS FUNCTION
         """
         raise NotImplementedError
+
@@ -1,10 +1,5 @@
-import sys
-import os
-
 from model_module.ArkModelNew import ArkModelLink, UserMessage, AIMessage, SystemMessage
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
 
 from state_module.state import State
 
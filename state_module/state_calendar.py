@@ -1,12 +1,24 @@
-import os
-import sys
+import asyncio
 from state_module.state import State
 from state_module.state_registry import register_state
 from model_module.ArkModelNew import ArkModelLink, UserMessage, AIMessage, SystemMessage, ToolMessage
 from tool_module.tool_call import MCPClient, MCPToolManager, MCPServerConfig
+from state_module.mcp_pool import get_manager, passthrough_env
 
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# built once at import; npx needs PATH and HOME (npm cache) besides the OAuth paths
+CALENDAR_MCP_CONFIG = {
+    "google-calendar": {
+        "command": "npx",
+        "args": ["@cocal/google-calendar-mcp"],
+        "env": {
+            **passthrough_env("PATH", "HOME"),
+            "GOOGLE_OAUTH_CREDENTIALS": "path-to-oauth.json",
+            "GOOGLE_CALENDAR_MCP_TOKEN_PATH": "path-to-google-generated-tokens.json",
+        },
+        "tools": ["list-events"],
+    }
+}
 
 
 @register_state
@@ -20,33 +32,39 @@ class StateCal(State):
     def check_transition_ready(self, context):
         return True
 
-    async def calendar_retrieval(self):
-        env = os.environ.copy()
-        env["GOOGLE_OAUTH_CREDENTIALS"] = "path-to-oauth.json"
-        env["GOOGLE_CALENDAR_MCP_TOKEN_PATH"] = "path-to-google-generated-tokens.json"
-        config = {
-            "google-calendar": {
-                "command": "npx",
-                "args": ["@cocal/google-calendar-mcp"],
-                "env": env
-            }
-        }
-
-        manager = MCPToolManager(config)
-        await manager.initialize_servers()
-        
-        result = await manager.call_tool("list-events", {
-            "calendarId": "primary",
-            "timeMin": "2025-11-27T00:00:00",
-            "timeMax": "2025-12-02T00:00:00",
-        })
-
-        assert result is not None
-
-        return result
+    async def calendar_retrieval(self, requests=None):
+        """
+        Lists events for one or more (calendarId, timeMin, timeMax) requests.
+        The MCP server has no batch tool, so the requests are issued
+        concurrently over the pooled connection and their results are joined
+        into one ToolMessage, one section per request.
+        """
+        manager = get_manager("google-calendar", CALENDAR_MCP_CONFIG)
+
+        if requests is None:
+            requests = [("primary", "2025-11-27T00:00:00", "2025-12-02T00:00:00")]
+
+        results = await asyncio.gather(*(
+            manager.call_tool(
+                "list-events",
+                {"calendarId": calendar_id, "timeMin": time_min, "timeMax": time_max},
+            )
+            for calendar_id, time_min, time_max in requests
+        ))
+
+        sections = []
+        for (calendar_id, time_min, time_max), result in zip(requests, results):
+            assert result is not None
+            text = "\n".join(
+                item["text"] for item in result.get("content", []) if item.get("type") == "text"
+            )
+            sections.append(f"{calendar_id} ({time_min} to {time_max}):\n{text}")
+
+        calendar_contents = "\n\n".join(sections)
+        return ToolMessage(content=f"Calendar Retreival Results \n\n {calendar_contents} \n\n Ensure you return control back to the user now", tool_calls={"CalendarTool": True})
 
     async def run(self, context, agent):
-        # calendar_contents = await self.calendar_retrieval()
+        # return await self.calendar_retrieval()
         calendar_contents = """
             calendar_placeholder = (
     "Calendar (placeholder)\n\n"
@@ -1,9 +1,6 @@
 import yaml
-import os
-import sys
-from typing import Dict, Any
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from functools import lru_cache
+from typing import Dict, Any, Tuple
 
 from state_module.state_registry import STATE_REGISTRY, auto_register_states
 from state_module.state import State
@@ -11,6 +8,26 @@ from state_module.state import State
 auto_register_states("state_module")
 
 
+@lru_cache(maxsize=128)
+def next_state_schema(state_names: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Builds the JSON schema for picking one of the given state names.
+    Emitted as a plain dict so the hot path never touches pydantic.
+    """
+
+    return {
+        "type": "object",
+        "properties": {
+            "next_state": {
+                "type": "string",
+                "enum": list(state_names),
+                "description": "The chosen next state",
+            }
+        },
+        "required": ["next_state"],
+    }
+
+
 class StateHandler:
     def __init__(self, yaml_path: str):
         with open(yaml_path, "r") as f:
@@ -26,6 +43,31 @@ class StateHandler:
 
         self.initial_state_name = self.graph["initial"]
 
+        # specialize every state for Agent.choose_transition once, at load time
+        for name, state in self.states.items():
+            transitions = self.get_transitions(state, None)
+
+            # a single outgoing edge needs neither a readiness check nor an LLM call
+            state.num_transitions = len(transitions["tt"])
+            if state.num_transitions == 1:
+                state.static_next = transitions["tt"][0]
+
+            # deterministic rendering keeps the transition prompt byte-identical
+            state.transition_prompt = "".join(
+                f"- {t}: {self.states[t].description}\n"
+                if self.states[t].description
+                else f"- {t}\n"
+                for t in sorted(transitions["tt"])
+            )
+
+            state.next_state_schema_envelope = {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "class_options",
+                    "schema": next_state_schema(tuple(sorted(transitions["tt"]))),
+                },
+            }
+
     def get_initial_state(self) -> State:
         return self.states[self.initial_state_name]
 
@@ -35,7 +77,7 @@ class StateHandler:
 
         transition_descs = []
         for t in transition_targets:
-            desc = getattr(self.states[t], "description", None)
+            desc = self.states[t].description
             transition_descs.append((t, desc))
 
         return {"td": transition_descs, "tt": transition_targets}
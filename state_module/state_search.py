@@ -1,13 +1,11 @@
-import os
-import sys
 import asyncio
-import json
+import orjson
 
 from state_module.state import State
 from state_module.state_registry import register_state
-from state_module.state_registry import register_state#
 from model_module.ArkModelNew import ArkModelLink, UserMessage, AIMessage, SystemMessage, ToolMessage
-from tool_module.tool_call import MCPClient, MCPToolManager, MCPServerConfig
+from tool_module.tool_call import MCPClient, MCPToolManager, MCPServerConfig, install_uvloop
+from state_module.mcp_pool import get_manager, passthrough_env
 
 
 
@@ -18,12 +16,15 @@ from tool_module.tool_call import MCPClient, MCPToolManager, MCPServerConfig
 # from ..tool_module.tool_call import MCPClient, MCPToolManager, MCPServerConfig
 
 
-
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-
-
+# built once at import; npx needs PATH and HOME (npm cache) besides the API key
+SEARCH_MCP_CONFIG = {
+    "brave-search-mcp-server": {
+        "command": "npx",
+        "args": ["-y", "@brave/brave-search-mcp-server", "--transport", "stdio"],
+        "env": passthrough_env("PATH", "HOME", "BRAVE_API_KEY"),
+        "tools": ["brave_web_search"],
+    }
+}
 
 
 @register_state
@@ -40,23 +41,9 @@ class StateSearch(State):
 
     async def brave_search(self, query):
         """Test actual tool execution."""
-        env = os.environ.copy()
-        # env["BRAVE_API_KEY"] = "BRAVE_API_KEY"
-        config = {   
-            "brave-search-mcp-server": {
-            "command": "npx",
-            "args": ["-y", "@brave/brave-search-mcp-server", "--transport", "stdio"],
-            "env": env
-            }
-        }
-
-        manager = MCPToolManager(config)
-        await manager.initialize_servers()
-        
-        tools = await manager.list_all_tools()
-        assert len(tools) > 0 
-        
-        # Test tool call for brave search mcp(assuming brave_web_search exists)
+        manager = get_manager("brave-search-mcp-server", SEARCH_MCP_CONFIG)
+
+        # starts the server on first use
         result = await manager.call_tool("brave_web_search", {
             "query": query,
             })
@@ -68,26 +55,35 @@ class StateSearch(State):
     def extract_top_k(self, response, k=2):
         assert not response["isError"]
 
+        # stops parsing once k results are collected
         parsed = []
         for item in response["content"]:
+            if len(parsed) >= k:
+                break
+
             if item.get("type") != "text":
                 continue
 
             try:
-                parsed.append(json.loads(item["text"]))
-            except json.JSONDecodeError:
+                parsed.append(orjson.loads(item["text"]))
+            except orjson.JSONDecodeError:
                 continue
 
-        return parsed[:k]
+        return parsed
 
     def parse_query(self, context, agent):
         """
         Extracts the most recent user query from context.
         """
 
-        # context = [long_term_mem] + short_term_mem
+        # the agent tracks the latest user turn as it is added to memory
+        query = agent.last_user_message
+        if query:
+            return query
+
+        # context = [system_prompt, long_term_mem] + short_term_mem
         # we care about short_term_mem only
-        messages = context[1:] if len(context) > 1 else context
+        messages = context[2:] if len(context) > 2 else context
 
         # walk backwards to find latest user message
         for msg in reversed(messages):
@@ -99,9 +95,6 @@ class StateSearch(State):
             return messages[-1].content
 
         raise ValueError("No valid query found in context")
-            
-
-        return query
 
     async def run(self, context, agent):
 
@@ -113,8 +106,8 @@ class StateSearch(State):
 
 
 if __name__ == "__main__":
+    install_uvloop()
     obj = StateSearch(name="name", config={"empty": "dict"})
-    print(obj.brave_search(query="Tell me about cats"))
     result = asyncio.run(obj.brave_search(query="Tell me about cats"))
 
     top_k = obj.extract_top_k(result)
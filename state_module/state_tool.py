@@ -1,9 +1,3 @@
-import os
-import sys
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-
 from model_module.ArkModelNew import ArkModelLink, UserMessage, AIMessage, SystemMessage
 
 from state_module.state import State
@@ -21,7 +15,7 @@ class StateTool(State):
     def check_transition_ready(self, context):
         return True
 
-    def run(self, context, agent=None):
+    async def run(self, context, agent=None):
 
 
         # extract tool name 
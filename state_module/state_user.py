@@ -1,15 +1,7 @@
-import os
-import sys
 from state_module.state import State
 from state_module.state_registry import register_state
 
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-
-
-
-
 @register_state
 class StateUser(State):
     type = "user"
@@ -1,6 +1,9 @@
+import os
+
 from google_auth_oauthlib.flow import InstalledAppFlow
 
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
+TOKEN_PATH = "secrets/google_tokens.json"
 
 flow = InstalledAppFlow.from_client_secrets_file(
     "secrets/gcp-oauth.keys.json",
@@ -9,7 +12,32 @@ flow = InstalledAppFlow.from_client_secrets_file(
 
 creds = flow.run_local_server(port=0)
 
-with open("secrets/google_tokens.json", "w") as f:
-    f.write(creds.to_json())
+token = creds.to_json().encode()
+
+try:
+    with open(TOKEN_PATH, "rb") as f:
+        unchanged = f.read() == token
+except OSError:
+    unchanged = False
+
+# created 0600 from the start and published with an atomic rename, so the
+# token is never readable by others or seen half-written
+if not unchanged:
+    tmp_path = f"{TOKEN_PATH}.{os.getpid()}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        # the file object loops over short writes
+        with os.fdopen(fd, "wb") as f:
+            f.write(token)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, TOKEN_PATH)
+    except BaseException:
+        # a leftover would make a later run with the same pid fail on O_EXCL
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
 
 print("OAuth complete. Tokens saved.")
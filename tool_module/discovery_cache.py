@@ -0,0 +1,128 @@
+"""
+On-disk cache of MCP tool discovery results.
+
+Discovering a stdio server's tools means spawning it and running the
+initialize + tools/list handshake. The result only changes when the server's
+launch configuration or the package it runs changes, so it is stored per
+server under a hash of the configuration and reused across process restarts
+until it expires. Packages fetched by `npx -y` can update without the config
+changing, which the expiry covers.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+from tool_module.tool_call import MCPServerConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path.home() / ".arkos" / "discovery_cache.json"
+
+# entries older than this are rediscovered
+DEFAULT_TTL = 24 * 60 * 60
+
+# bumped when the file layout or the key changes, older files are ignored
+CACHE_VERSION = 2
+
+
+class DiscoveryCache:
+    """
+    Tool catalogs of MCP servers, keyed on their launch configuration.
+
+    Parameters
+    ----------
+    path : Optional[Path]
+        JSON file backing the cache, ~/.arkos/discovery_cache.json by default
+    ttl : float
+        Seconds an entry stays valid
+    """
+
+    def __init__(self, path: Optional[Path] = None, ttl: float = DEFAULT_TTL):
+        self.path = Path(path) if path is not None else DEFAULT_CACHE_PATH
+        self.ttl = ttl
+        # server name -> {"key": config hash, "stored_at": time, "tools": [...]}, read lazily
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        # serializes read-merge-write of the file between threads
+        self._write_lock = Lock()
+
+    @staticmethod
+    def key(config: MCPServerConfig) -> str:
+        """
+        Hash everything in the config that decides which tools a server exposes.
+
+        Covers the server name, command, args and the env given in the config,
+        never the parent process environment.
+        """
+        material = orjson.dumps([
+            config.name,
+            config.command,
+            list(config.args),
+            sorted((config.env or {}).items()),
+        ])
+        return hashlib.sha256(material).hexdigest()
+
+    def get(self, config: MCPServerConfig) -> Optional[List[Dict[str, Any]]]:
+        """Return the cached tools of a server, or None if missing, stale or expired."""
+        entry = self._load().get(config.name)
+        if entry is None or entry.get("key") != self.key(config):
+            return None
+        if time.time() - entry.get("stored_at", 0) >= self.ttl:
+            return None
+        return entry["tools"]
+
+    def put(self, config: MCPServerConfig, tools: List[Dict[str, Any]]) -> None:
+        """
+        Store the tools of a server, replacing any older entry for it.
+
+        The file is re-read first so entries written by other processes or
+        instances since it was loaded are kept.
+        """
+        entry = {"key": self.key(config), "stored_at": time.time(), "tools": tools}
+
+        with self._write_lock:
+            entries = self._read()
+            entries[config.name] = entry
+            self._entries = entries
+
+            # best effort, write atomically so concurrent processes never read a partial file
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+                with os.fdopen(fd, "wb") as f:
+                    f.write(orjson.dumps({"version": CACHE_VERSION, "servers": entries}))
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                logger.warning("Could not write discovery cache %s: %s", self.path, e)
+
+    async def put_async(self, config: MCPServerConfig, tools: List[Dict[str, Any]]) -> None:
+        """put() in a worker thread, keeping file I/O off the event loop."""
+        await asyncio.to_thread(self.put, config, tools)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Read the cache file once."""
+        if self._entries is None:
+            self._entries = self._read()
+        return self._entries
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        """Read the cache file, treating a missing, corrupt or outdated file as empty."""
+        try:
+            data = orjson.loads(self.path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return {}
+        return data.get("servers") or {}
+
+
+# Create global cache instance, shared so writers do not overwrite each other
+discovery_cache = DiscoveryCache()
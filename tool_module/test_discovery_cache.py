@@ -0,0 +1,93 @@
+import sys
+import time
+
+import orjson
+import pytest
+
+from tool_module.discovery_cache import DiscoveryCache
+from tool_module.tool_call import MCPServerConfig, MCPToolManager
+from tool_module.test_mcp_client import FAKE_SERVER
+
+TOOLS = [{"name": "echo"}]
+
+
+def make_config(name="fake", **env):
+    return MCPServerConfig(name=name, command="npx", args=("-y", "server"), env=env)
+
+
+def test_key_ignores_process_environment(monkeypatch):
+    config = make_config(API_KEY="x")
+    key = DiscoveryCache.key(config)
+
+    monkeypatch.setenv("SHLVL", "7")
+    monkeypatch.setenv("PWD", "/somewhere/else")
+    assert DiscoveryCache.key(config) == key
+
+    assert DiscoveryCache.key(make_config(API_KEY="y")) != key
+
+
+def test_entries_expire(tmp_path, monkeypatch):
+    cache = DiscoveryCache(tmp_path / "cache.json", ttl=60)
+    config = make_config()
+    cache.put(config, TOOLS)
+    assert cache.get(config) == TOOLS
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+    assert cache.get(config) is None
+
+
+def test_instances_do_not_overwrite_each_other(tmp_path):
+    path = tmp_path / "cache.json"
+    first, second = DiscoveryCache(path), DiscoveryCache(path)
+    # both have loaded the (empty) file before either writes
+    assert first.get(make_config("a")) is None
+    assert second.get(make_config("b")) is None
+
+    first.put(make_config("a"), TOOLS)
+    second.put(make_config("b"), TOOLS)
+
+    fresh = DiscoveryCache(path)
+    assert fresh.get(make_config("a")) == TOOLS
+    assert fresh.get(make_config("b")) == TOOLS
+
+
+def test_outdated_or_corrupt_file_is_empty(tmp_path):
+    path = tmp_path / "cache.json"
+    config = make_config()
+
+    path.write_bytes(b"not json")
+    assert DiscoveryCache(path).get(config) is None
+
+    path.write_bytes(orjson.dumps({"fake": {"key": DiscoveryCache.key(config), "tools": TOOLS}}))
+    assert DiscoveryCache(path).get(config) is None
+
+
+@pytest.mark.asyncio
+async def test_cached_server_starts_on_first_call(tmp_path):
+    servers = {
+        "fake": {
+            "command": sys.executable,
+            "args": ["-c", FAKE_SERVER],
+            "env": {"CALL_LOG": str(tmp_path / "calls.log")},
+        }
+    }
+    path = tmp_path / "cache.json"
+
+    manager = MCPToolManager(servers, discovery_cache=DiscoveryCache(path))
+    await manager.initialize_servers()
+    assert "fake" in manager.clients
+    await manager.shutdown()
+
+    # second process: catalog comes from disk, the server is not spawned yet
+    manager = MCPToolManager(servers, discovery_cache=DiscoveryCache(path))
+    await manager.initialize_servers()
+    try:
+        assert not manager.clients
+        assert {tool["name"] for tool in await manager.list_all_tools()} == {"echo", "die", "lookup"}
+
+        result = await manager.call_tool("echo", {"x": 1})
+        assert result["isError"] is False
+        assert "fake" in manager.clients
+    finally:
+        await manager.shutdown()
@@ -0,0 +1,187 @@
+import asyncio
+import sys
+
+import pytest
+
+from tool_module import tool_call
+from tool_module.tool_call import MCPClient, MCPServerConfig, MCPToolManager
+
+# Minimal stdio MCP server. Every tools/call and tools/list is logged to
+# $CALL_LOG before it is handled; "die" exits mid-request, "lookup" is
+# read-only and slow, and tools/list exits mid-request the first time if
+# $DIE_ON_FIRST_LIST is set. With $STRAY_OUTPUT set it prints JSON that is not
+# a message before answering initialize, and if the file $FAIL_INIT exists it
+# is removed and the server exits on initialize.
+FAKE_SERVER = r"""
+import json, os, sys, time
+
+log = os.environ["CALL_LOG"]
+
+def seen(method):
+    with open(log, "a") as f:
+        f.write(method + "\n")
+    with open(log) as f:
+        return f.read().count(method + "\n")
+
+for line in sys.stdin:
+    req = json.loads(line)
+    if "id" not in req:
+        continue
+    method = req["method"]
+    if method == "initialize" and os.environ.get("STRAY_OUTPUT"):
+        print('42\n"text"\n[1, 2]\nnull', flush=True)
+    if method == "initialize" and os.path.exists(os.environ.get("FAIL_INIT", "")):
+        os.remove(os.environ["FAIL_INIT"])
+        os._exit(3)
+    if method == "tools/call":
+        seen("tools/call")
+        args = req["params"]["arguments"]
+        if req["params"]["name"] == "die":
+            os._exit(3)
+        if req["params"]["name"] == "lookup":
+            time.sleep(0.2)
+        result = {"content": [{"type": "text", "text": json.dumps(args)}], "isError": False}
+    elif method == "tools/list":
+        if seen("tools/list") == 1 and os.environ.get("DIE_ON_FIRST_LIST"):
+            os._exit(3)
+        result = {"tools": [
+            {"name": "echo"},
+            {"name": "die"},
+            {"name": "lookup", "annotations": {"readOnlyHint": True}},
+        ]}
+    else:
+        result = {}
+    print(json.dumps({"jsonrpc": "2.0", "id": req["id"], "result": result}), flush=True)
+"""
+
+
+def make_client(tmp_path, **env):
+    log = tmp_path / "calls.log"
+    config = MCPServerConfig(
+        name="fake",
+        command=sys.executable,
+        args=("-c", FAKE_SERVER),
+        env={"CALL_LOG": str(log), **env},
+    )
+    return MCPClient(config), log
+
+
+def count(log, method):
+    return log.read_text().splitlines().count(method) if log.exists() else 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_matched_by_id(tmp_path):
+    client, _ = make_client(tmp_path)
+    await client.start()
+    try:
+        results = await asyncio.gather(*(client.call_tool("echo", {"i": i}) for i in range(5)))
+        assert [r["content"][0]["text"] for r in results] == [f'{{"i": {i}}}' for i in range(5)]
+    finally:
+        await client.stop()
+
+
+@pytest.mark.asyncio
+async def test_tool_call_is_not_resent_after_crash(tmp_path):
+    client, log = make_client(tmp_path)
+    await client.start()
+    try:
+        with pytest.raises(ConnectionError):
+            await client.call_tool("die", {})
+        assert count(log, "tools/call") == 1
+
+        # the server was restarted for the next call
+        result = await client.call_tool("echo", {"ok": True})
+        assert result["isError"] is False
+    finally:
+        await client.stop()
+
+
+@pytest.mark.asyncio
+async def test_list_tools_is_retried_after_crash(tmp_path):
+    client, log = make_client(tmp_path, DIE_ON_FIRST_LIST="1")
+    await client.start()
+    try:
+        tools = await client.list_tools()
+        assert [tool["name"] for tool in tools] == ["echo", "die", "lookup"]
+        assert count(log, "tools/list") == 2
+    finally:
+        await client.stop()
+
+
+@pytest.mark.asyncio
+async def test_exited_server_is_restarted_before_sending(tmp_path):
+    client, log = make_client(tmp_path)
+    await client.start()
+    try:
+        client.process.kill()
+        await client.process.wait()
+
+        result = await client.call_tool("echo", {})
+        assert result["isError"] is False
+        assert count(log, "tools/call") == 1
+    finally:
+        await client.stop()
+
+
+@pytest.mark.asyncio
+async def test_failed_restart_is_retried_on_next_call(tmp_path, monkeypatch):
+    monkeypatch.setattr(tool_call, "RESTART_BACKOFF", 0)
+    marker = tmp_path / "fail_init"
+    client, log = make_client(tmp_path, FAIL_INIT=str(marker))
+    await client.start()
+    try:
+        marker.touch()
+        client.process.kill()
+        await client.process.wait()
+
+        # the restart dies during initialize
+        with pytest.raises(ConnectionError):
+            await client.call_tool("echo", {})
+        assert client.process is None
+
+        result = await client.call_tool("echo", {})
+        assert result["isError"] is False
+        assert count(log, "tools/call") == 1
+    finally:
+        await client.stop()
+
+
+@pytest.mark.asyncio
+async def test_identical_read_only_calls_are_coalesced(tmp_path):
+    log = tmp_path / "calls.log"
+    manager = MCPToolManager({
+        "fake": {
+            "command": sys.executable,
+            "args": ["-c", FAKE_SERVER],
+            "env": {"CALL_LOG": str(log)},
+        }
+    })
+    await manager.initialize_servers()
+    try:
+        results = await asyncio.gather(
+            manager.call_tool("lookup", {"q": 1, "n": 2}),
+            manager.call_tool("lookup", {"n": 2, "q": 1}),
+            manager.call_tool("lookup", {"q": 1, "n": 2}),
+            manager.call_tool("lookup", {"q": 3}),
+        )
+        assert results[0] == results[1] == results[2] != results[3]
+        assert count(log, "tools/call") == 2
+
+        # echo is not read-only, every call reaches the server
+        await asyncio.gather(*(manager.call_tool("echo", {}) for _ in range(2)))
+        assert count(log, "tools/call") == 4
+    finally:
+        await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_non_object_output_is_ignored(tmp_path):
+    client, _ = make_client(tmp_path, STRAY_OUTPUT="1")
+    await client.start()
+    try:
+        assert not client._reader_task.done()
+        result = await client.call_tool("echo", {})
+        assert result["isError"] is False
+    finally:
+        await client.stop()
@@ -6,17 +6,86 @@ and executes tool calls via JSON-RPC 2.0 over stdio.
 """
 
 import asyncio
-import json
+import contextlib
+import itertools
 import logging
-import subprocess
-from typing import Any, Dict, List, Optional, Tuple
+import sys
+import time
+import orjson
+from typing import (
+    TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set,
+    Tuple,
+)
 from dataclasses import dataclass
-from threading import Lock
+
+if TYPE_CHECKING:
+    from tool_module.discovery_cache import DiscoveryCache
 
 logger = logging.getLogger(__name__)
 
+# StreamReader buffer for server stdout; one JSON-RPC response is one line and
+# search/calendar results easily exceed asyncio's 64 KiB default, large tool
+# outputs (file contents, long event lists) can run to megabytes
+STDIO_BUFFER_LIMIT = 16 << 20
+
+# how long a list_all_tools result is reused before the servers are asked again
+TOOLS_CACHE_TTL = 300.0
+
+# JSON-RPC methods and the static handshake payload, built once
+METHOD_INITIALIZE = "initialize"
+METHOD_INITIALIZED = "notifications/initialized"
+METHOD_TOOLS_LIST = "tools/list"
+METHOD_TOOLS_CALL = "tools/call"
+METHOD_TOOLS_LIST_CHANGED = "notifications/tools/list_changed"
+
+INITIALIZE_PARAMS = {
+    "protocolVersion": "2024-11-05",
+    "capabilities": {},
+    "clientInfo": {
+        "name": "arkos",
+        "version": "1.0.0"
+    }
+}
+
+# the notification closing the handshake never changes, keep it encoded
+INITIALIZED_LINE = orjson.dumps(
+    {"jsonrpc": "2.0", "method": METHOD_INITIALIZED, "params": {}},
+    option=orjson.OPT_APPEND_NEWLINE,
+)
+
+# times a request is retried on a restarted server after the pipes broke
+MAX_RECONNECTS = 1
+
+# seconds before a request tries again to start a server whose restart failed
+RESTART_BACKOFF = 5.0
+
+
+def install_uvloop() -> bool:
+    """
+    Make uvloop the default event loop policy when it is installed.
+
+    Call before asyncio.run in standalone entry points; uvicorn selects
+    uvloop on its own. Returns whether uvloop was installed.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    uvloop.install()
+    return True
+
+
+def _is_read_only(tool: Dict[str, Any]) -> bool:
+    """Whether a tool definition is annotated as free of side effects."""
+    return bool((tool.get("annotations") or {}).get("readOnlyHint"))
+
+
+class _NotSent(ConnectionError):
+    """The connection was lost before the request was written to the server."""
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class MCPServerConfig:
     """Configuration for an MCP server connection."""
 
@@ -25,6 +94,16 @@ class MCPServerConfig:
     args: List[str]
     env: Optional[Dict[str, str]] = None
 
+    @classmethod
+    def from_dict(cls, name: str, config: Dict[str, Any]) -> "MCPServerConfig":
+        """Build a server config from its entry in the mcp_servers mapping."""
+        return cls(
+            name=sys.intern(name),
+            command=config["command"],
+            args=config["args"],
+            env=config.get("env"),
+        )
+
 
 class MCPClient:
     """
@@ -42,16 +121,26 @@ class MCPClient:
     ----------
     process : Optional[asyncio.subprocess.Process]
         The running subprocess for the MCP server
-    request_id : int
-        Counter for JSON-RPC request IDs
     """
 
     def __init__(self, config: MCPServerConfig):
         self.config = config
         self.process: Optional[asyncio.subprocess.Process] = None
-        self.request_id = 0
-        self._lock = Lock()
-        self._initialized = False
+        # JSON-RPC request ids; only used from the event loop, no lock needed
+        self._next_id = itertools.count(1).__next__
+        # drain of stdin shared by everyone who wrote while it was pending
+        self._drain: Optional[asyncio.Future] = None
+        # request id -> future resolved by the reader task with the response
+        self._responses: Dict[Any, asyncio.Future] = {}
+        self._reader_task: Optional[asyncio.Task] = None
+        self._stderr_task: Optional[asyncio.Task] = None
+        # set once the initialize handshake has completed
+        self._ready = asyncio.Event()
+        self._reconnect_lock = asyncio.Lock()
+        # monotonic time of the last failed restart, None unless the server is down
+        self._restart_failed_at: Optional[float] = None
+        # tools/list result, dropped on stop() or a tools/list_changed notification
+        self._tools_cache: Optional[List[Dict[str, Any]]] = None
 
     async def start(self) -> None:
         """
@@ -62,10 +151,33 @@ class MCPClient:
         RuntimeError
             If the server fails to start or initialize
         """
-        logger.info(f"Starting MCP server: {self.config.name}")
+        await self._start(list_tools=False)
+
+    async def start_and_list(self) -> List[Dict[str, Any]]:
+        """
+        Start the server and fetch its tool list as part of the handshake.
+
+        The initialized notification and the tools/list request go out in
+        one write, saving a round trip through the event loop per server.
 
-        # Build environment
-        env = dict(self.config.env) if self.config.env else {}
+        Returns
+        -------
+        List[Dict[str, Any]]
+            List of tool definitions with name, description, and input schema
+
+        Raises
+        ------
+        RuntimeError
+            If the server fails to start, initialize or list its tools
+        """
+        return await self._start(list_tools=True)
+
+    async def _start(self, list_tools: bool) -> Optional[List[Dict[str, Any]]]:
+        """Spawn the server, run the handshake and optionally list tools."""
+        logger.info("Starting MCP server: %s", self.config.name)
+
+        # the subprocess only reads the config's env, no need to copy it per start
+        env = self.config.env or {}
 
         try:
             # Start subprocess
@@ -75,52 +187,121 @@ class MCPClient:
                 stdin=asyncio.subprocess.PIPE,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                env=env
+                env=env,
+                limit=STDIO_BUFFER_LIMIT,
             )
+            self._reader_task = asyncio.create_task(self._read_loop(self.process))
+            # an unread stderr pipe fills up and blocks the server mid-write
+            self._stderr_task = asyncio.create_task(self._drain_stderr(self.process))
 
             # Initialize MCP connection
-            init_response = await self._send_request("initialize", {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {
-                    "name": "arkos",
-                    "version": "1.0.0"
-                }
-            })
+            init_response = await self._send_request(METHOD_INITIALIZE, INITIALIZE_PARAMS)
 
             if "error" in init_response:
                 raise RuntimeError(f"MCP initialization failed: {init_response['error']}")
 
-            # Send initialized notification
-            await self._send_notification("notifications/initialized", {})
+            tools = None
+            if list_tools:
+                # tools/list is legal right after the notification, pipeline them
+                response = await self._send_request(METHOD_TOOLS_LIST, {}, preamble=INITIALIZED_LINE)
+                tools = await self._cache_tools(response)
+            else:
+                # Send initialized notification
+                await self._write(INITIALIZED_LINE)
 
-            self._initialized = True
-            logger.info(f"MCP server '{self.config.name}' initialized successfully")
+            self._ready.set()
+            logger.info("MCP server '%s' initialized successfully", self.config.name)
+            return tools
 
         except Exception as e:
-            logger.error(f"Failed to start MCP server '{self.config.name}': {e}")
+            logger.error("Failed to start MCP server '%s': %s", self.config.name, e)
             await self.stop()
             raise
 
+    @property
+    def _initialized(self) -> bool:
+        return self._ready.is_set()
+
+    async def wait_ready(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait until the server has completed its initialize handshake.
+
+        Raises
+        ------
+        asyncio.TimeoutError
+            If the server is not ready within timeout seconds
+        """
+        await asyncio.wait_for(self._ready.wait(), timeout)
+
+    async def _require_ready(self) -> None:
+        """
+        Raise unless initialized, waiting out a restart that is in progress.
+
+        A server whose restart failed is started again once RESTART_BACKOFF
+        has passed, so a single failed restart does not disable it for good.
+        """
+        if self._ready.is_set():
+            return
+
+        if self._reconnect_lock.locked():
+            async with self._reconnect_lock:
+                pass
+            if self._ready.is_set():
+                return
+
+        if self._restart_failed_at is not None:
+            if time.monotonic() - self._restart_failed_at < RESTART_BACKOFF:
+                raise ConnectionError(f"MCP server '{self.config.name}' is down, restart failed")
+            logger.warning("MCP server '%s' is down, retrying restart", self.config.name)
+            await self._reconnect(None)
+            return
+
+        raise RuntimeError(f"MCP server '{self.config.name}' not initialized")
+
     async def stop(self) -> None:
         """Stop the MCP server subprocess gracefully."""
+        # a stopped client stays stopped, only a failed restart is retried
+        self._restart_failed_at = None
+        # stop reading first so in-flight requests fail as stopped rather
+        # than as a lost connection, which would trigger a restart
+        tasks = [t for t in (self._reader_task, self._stderr_task) if t is not None]
+        self._reader_task = self._stderr_task = None
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
         if self.process:
-            logger.info(f"Stopping MCP server: {self.config.name}")
+            logger.info("Stopping MCP server: %s", self.config.name)
             try:
                 self.process.terminate()
                 await asyncio.wait_for(self.process.wait(), timeout=5.0)
+            except ProcessLookupError:
+                # already exited
+                pass
             except asyncio.TimeoutError:
-                logger.warning(f"Force killing MCP server: {self.config.name}")
+                logger.warning("Force killing MCP server: %s", self.config.name)
                 self.process.kill()
                 await self.process.wait()
             finally:
                 self.process = None
-                self._initialized = False
+                self._drain = None
+                self._ready.clear()
+                self._tools_cache = None
 
-    async def list_tools(self) -> List[Dict[str, Any]]:
+    async def list_tools(self, force_refresh: bool = False) -> List[Dict[str, Any]]:
         """
         Request list of available tools from the MCP server.
 
+        The result is cached until the server is stopped or reports that its
+        tool list changed.
+
+        Parameters
+        ----------
+        force_refresh : bool
+            Ask the server even if a cached list is available
+
         Returns
         -------
         List[Dict[str, Any]]
@@ -131,18 +312,74 @@ class MCPClient:
         RuntimeError
             If server is not initialized or request fails
         """
-        if not self._initialized:
-            raise RuntimeError(f"MCP server '{self.config.name}' not initialized")
+        await self._require_ready()
+
+        if self._tools_cache is not None and not force_refresh:
+            return self._tools_cache
 
-        response = await self._send_request("tools/list", {})
+        response = await self._with_reconnect(self._send_request, METHOD_TOOLS_LIST, {})
+        return await self._cache_tools(response)
+
+    async def iter_tools(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield the server's tools as each tools/list page arrives.
 
-        if "error" in response:
-            raise RuntimeError(f"tools/list failed: {response['error']}")
+        Serves from the cached list when there is one; otherwise follows
+        nextCursor page by page without collecting or caching the pages.
 
-        tools = response.get("result", {}).get("tools", [])
-        logger.debug(f"Server '{self.config.name}' has {len(tools)} tools")
+        Raises
+        ------
+        RuntimeError
+            If server is not initialized or request fails
+        """
+        await self._require_ready()
+
+        if self._tools_cache is not None:
+            for tool in self._tools_cache:
+                yield tool
+            return
+
+        params: Dict[str, Any] = {}
+        while True:
+            response = await self._with_reconnect(self._send_request, METHOD_TOOLS_LIST, params)
+            result = self._tools_page(response)
+            for tool in result.get("tools", []):
+                yield tool
+
+            cursor = result.get("nextCursor")
+            if not cursor:
+                return
+            params = {"cursor": cursor}
+
+    async def _cache_tools(self, response: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Collect all pages starting from a tools/list response and cache them."""
+        tools: List[Dict[str, Any]] = []
+        while True:
+            result = self._tools_page(response)
+            tools.extend(result.get("tools", []))
+
+            cursor = result.get("nextCursor")
+            if not cursor:
+                break
+            response = await self._send_request(METHOD_TOOLS_LIST, {"cursor": cursor})
+
+        # names key the manager's routing tables, intern them for identity hits
+        for tool in tools:
+            tool["name"] = sys.intern(tool["name"])
+
+        logger.debug("Server '%s' has %d tools", self.config.name, len(tools))
+        self._tools_cache = tools
         return tools
 
+    @staticmethod
+    def _tools_page(response: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the result of a tools/list response, raising on an error response."""
+        # a JSON-RPC response carries exactly one of result and error
+        try:
+            return response["result"]
+        except KeyError:
+            raise RuntimeError(f"tools/list failed: {response.get('error')}") from None
+
     async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Any:
         """
         Execute a tool on the MCP server.
@@ -164,27 +401,217 @@ class MCPClient:
         RuntimeError
             If server is not initialized or tool execution fails
         """
-        if not self._initialized:
-            raise RuntimeError(f"MCP server '{self.config.name}' not initialized")
+        await self._require_ready()
 
-        logger.info(f"Calling tool '{name}' on server '{self.config.name}'")
-        logger.debug(f"Arguments: {arguments}")
+        logger.info("Calling tool '%s' on server '%s'", name, self.config.name)
+        logger.debug("Arguments: %s", arguments)
 
-        response = await self._send_request("tools/call", {
+        response = await self._with_reconnect(self._send_request, METHOD_TOOLS_CALL, {
             "name": name,
             "arguments": arguments
-        })
-
-        if "error" in response:
-            error_msg = response["error"]
-            logger.error(f"Tool call failed: {error_msg}")
-            raise RuntimeError(f"Tool '{name}' execution failed: {error_msg}")
+        }, retry=False)
 
-        result = response.get("result", {})
-        logger.debug(f"Tool result: {result}")
+        result = self._tool_result(name, response)
+        # results can be large, skip even the repr unless debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Tool result: %r", result)
         return result
 
-    async def _send_request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _tool_result(name: str, response: Dict[str, Any]) -> Any:
+        """Return a tools/call result, raising RuntimeError for an error response."""
+        # a JSON-RPC response carries exactly one of result and error
+        try:
+            return response["result"]
+        except KeyError:
+            error_msg = response.get("error")
+            logger.error("Tool call failed: %s", error_msg)
+            raise RuntimeError(f"Tool '{name}' execution failed: {error_msg}") from None
+
+    async def _with_reconnect(
+        self, send: Callable[..., Awaitable[Any]], *args: Any, retry: bool = True
+    ) -> Any:
+        """
+        Run send(*args), restarting the server if its pipes are broken.
+
+        The subprocess is kept for the life of the client; if it has exited
+        or the pipes fail mid-request it is restarted and the request is sent
+        again, up to MAX_RECONNECTS times. With retry=False (tools/call, which
+        may have side effects) a request is only sent again if it never
+        reached the server; otherwise the server is restarted for the next
+        request and the error is raised.
+        """
+        await self._ensure_alive()
+
+        for attempt in range(MAX_RECONNECTS + 1):
+            process = self.process
+            try:
+                return await send(*args)
+            except (ConnectionError, EOFError) as e:
+                if attempt == MAX_RECONNECTS:
+                    raise
+                logger.warning("MCP server '%s' connection lost (%s), restarting", self.config.name, e)
+                await self._reconnect(process)
+                if not retry and not isinstance(e, _NotSent):
+                    raise
+
+    async def _ensure_alive(self) -> None:
+        """Restart the server if its subprocess has exited."""
+        process = self.process
+        if process is not None and process.returncode is not None:
+            logger.warning(
+                "MCP server '%s' exited with code %d, restarting", self.config.name, process.returncode
+            )
+            await self._reconnect(process)
+
+    async def _reconnect(self, failed_process: Optional[asyncio.subprocess.Process]) -> None:
+        """Replace failed_process with a freshly started and initialized server."""
+        async with self._reconnect_lock:
+            # a concurrent caller already restarted it
+            if self.process is not failed_process and self._ready.is_set():
+                return
+
+            await self.stop()
+            try:
+                await self.start()
+            except Exception:
+                self._restart_failed_at = time.monotonic()
+                raise
+
+    def _encode(self, message: Any) -> bytes:
+        """Serialize one outgoing JSON-RPC message as a newline-terminated line."""
+        line = orjson.dumps(message, option=orjson.OPT_APPEND_NEWLINE)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[%s] >> %s", self.config.name, line[:-1].decode())
+        return line
+
+    async def _write(self, data: bytes) -> None:
+        """
+        Write encoded messages to the server's stdin.
+
+        Each write is a whole frame, so concurrent writers never interleave.
+        Writers arriving while a drain is pending join it instead of starting
+        their own, so a burst of requests costs one drain.
+        """
+        self.process.stdin.write(data)
+        if self._drain is None:
+            self._drain = asyncio.ensure_future(self.process.stdin.drain())
+            self._drain.add_done_callback(self._drain_done)
+        # shielded, a cancelled caller must not cancel the others' drain
+        await asyncio.shield(self._drain)
+
+    def _drain_done(self, drain: asyncio.Future) -> None:
+        """Let the next write start a fresh drain."""
+        if self._drain is drain:
+            self._drain = None
+        if not drain.cancelled():
+            # mark retrieved, waiters that are still around have seen it
+            drain.exception()
+
+    def _expect(self, req_id: Any) -> asyncio.Future:
+        """Register a future for the response to req_id."""
+        # the reader is gone once stdout hit EOF, nothing would resolve it
+        if self._reader_task is None or self._reader_task.done():
+            raise _NotSent(f"MCP server '{self.config.name}' closed connection")
+
+        future = asyncio.get_running_loop().create_future()
+        self._responses[req_id] = future
+        return future
+
+    async def _read_loop(self, process: asyncio.subprocess.Process) -> None:
+        """
+        Read messages from the server for as long as it runs.
+
+        Responses resolve the future registered under their id, so any number
+        of requests can be in flight on the one pipe. Notifications and
+        server-initiated requests are handled as they arrive.
+        """
+        error: Exception = ConnectionError(f"MCP server '{self.config.name}' closed connection")
+        try:
+            at_eof = False
+            while not at_eof:
+                try:
+                    line = await process.stdout.readuntil(b"\n")
+                except asyncio.IncompleteReadError as e:
+                    # EOF, possibly right after a last frame without newline
+                    line, at_eof = e.partial, True
+                    if not line.strip():
+                        break
+
+                try:
+                    message = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    logger.warning("[%s] ignoring non-JSON output: %r", self.config.name, line[:200])
+                    continue
+
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[%s] << %s", self.config.name, line.decode().rstrip())
+
+                self._dispatch(message)
+
+        except asyncio.CancelledError:
+            error = RuntimeError(f"MCP server '{self.config.name}' stopped")
+            raise
+        except Exception as e:
+            error = ConnectionError(f"MCP server '{self.config.name}' read failed: {e}")
+        finally:
+            responses, self._responses = self._responses, {}
+            for future in responses.values():
+                if not future.done():
+                    future.set_exception(error)
+
+    async def _drain_stderr(self, process: asyncio.subprocess.Process) -> None:
+        """Forward the server's stderr to the debug log, line by line."""
+        while True:
+            try:
+                line = await process.stderr.readline()
+            except ValueError:
+                # line over the buffer limit, already discarded
+                continue
+            if not line:
+                return
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[%s] stderr: %s", self.config.name, line.decode(errors="replace").rstrip())
+
+    def _dispatch(self, message: Dict[str, Any]) -> None:
+        """Route one incoming message to its waiter or handler."""
+        # a stray scalar or array on stdout must not take the reader down
+        if not isinstance(message, dict):
+            logger.warning("[%s] ignoring non-object message: %r", self.config.name, message)
+            return
+
+        if "method" in message:
+            if "id" in message:
+                self._answer_server_request(message)
+            else:
+                self._handle_notification(message)
+            return
+
+        req_id = message.get("id")
+        future = self._responses.pop(req_id, None)
+        if future is not None:
+            if not future.done():
+                future.set_result(message)
+            return
+
+        logger.debug("[%s] unmatched response id %r", self.config.name, req_id)
+
+    def _answer_server_request(self, message: Dict[str, Any]) -> None:
+        """Reply to a server-initiated request; only ping is supported."""
+        if message["method"] == "ping":
+            reply = {"jsonrpc": "2.0", "id": message["id"], "result": {}}
+        else:
+            reply = {
+                "jsonrpc": "2.0",
+                "id": message["id"],
+                "error": {"code": -32601, "message": f"Method not found: {message['method']}"},
+            }
+        # a single small line, the transport buffers it without a drain
+        self.process.stdin.write(self._encode(reply))
+
+    async def _send_request(
+        self, method: str, params: Dict[str, Any], preamble: bytes = b""
+    ) -> Dict[str, Any]:
         """
         Send a JSON-RPC 2.0 request and wait for response.
 
@@ -194,15 +621,15 @@ class MCPClient:
             JSON-RPC method name
         params : Dict[str, Any]
             Method parameters
+        preamble : bytes
+            Already encoded messages to write in front of the request
 
         Returns
         -------
         Dict[str, Any]
             JSON-RPC response
         """
-        with self._lock:
-            self.request_id += 1
-            req_id = self.request_id
+        req_id = self._next_id()
 
         request = {
             "jsonrpc": "2.0",
@@ -211,36 +638,20 @@ class MCPClient:
             "params": params
         }
 
-        logger.debug(f"[{self.config.name}] >> {json.dumps(request)}")
-
-        # Send request
-        request_line = json.dumps(request) + "\n"
-        self.process.stdin.write(request_line.encode())
-        await self.process.stdin.drain()
+        request_line = self._encode(request)
 
-        # Read response
-        response_line = await self.process.stdout.readline()
-        if not response_line:
-            raise RuntimeError(f"MCP server '{self.config.name}' closed connection")
-
-        response = json.loads(response_line.decode())
-        logger.debug(f"[{self.config.name}] << {json.dumps(response)}")
-
-        return response
-
-    async def _send_notification(self, method: str, params: Dict[str, Any]) -> None:
-        """Send a JSON-RPC 2.0 notification (no response expected)."""
-        notification = {
-            "jsonrpc": "2.0",
-            "method": method,
-            "params": params
-        }
-
-        logger.debug(f"[{self.config.name}] >> {json.dumps(notification)}")
+        # responses are matched by id, so concurrent requests share the pipe
+        future = self._expect(req_id)
+        try:
+            await self._write(preamble + request_line if preamble else request_line)
+            return await future
+        finally:
+            self._responses.pop(req_id, None)
 
-        notification_line = json.dumps(notification) + "\n"
-        self.process.stdin.write(notification_line.encode())
-        await self.process.stdin.drain()
+    def _handle_notification(self, message: Dict[str, Any]) -> None:
+        """React to a server-initiated JSON-RPC notification."""
+        if message.get("method") == METHOD_TOOLS_LIST_CHANGED:
+            self._tools_cache = None
 
 
 class MCPToolManager:
@@ -248,12 +659,18 @@ class MCPToolManager:
     Manages multiple MCP server connections and provides unified tool interface.
 
     Coordinates tool discovery across all servers and routes tool execution
-    to the appropriate server.
+    to the appropriate server. All server I/O runs on the caller's event
+    loop, which benefits from uvloop where installed (see install_uvloop).
 
     Parameters
     ----------
     config : Dict[str, Dict[str, Any]]
         MCP servers configuration from config file
+    max_concurrent_init : int
+        Most servers spawned and handshaking at the same time
+    discovery_cache : Optional[DiscoveryCache]
+        Persisted tool catalogs; servers found in it are not started until
+        a tool call needs them
 
     Attributes
     ----------
@@ -261,75 +678,253 @@ class MCPToolManager:
         Active MCP client connections by server name
     """
 
-    def __init__(self, config: Dict[str, Dict[str, Any]]):
+    def __init__(
+        self,
+        config: Dict[str, Dict[str, Any]],
+        max_concurrent_init: int = 8,
+        discovery_cache: Optional["DiscoveryCache"] = None,
+    ):
         self.config = config
+        self._discovery = discovery_cache
         self.clients: Dict[str, MCPClient] = {}
         self._tool_registry: Dict[str, str] = {}  # tool_name -> server_name
+        # tool_name -> client, for tools whose server is connected
+        self._tool_to_client: Dict[str, MCPClient] = {}
+        # read-only tools whose identical concurrent calls share one request
+        self._coalesce: Set[str] = set()
+        self._inflight: Dict[Tuple[str, bytes], asyncio.Future] = {}
+        # servers registered by register_servers but not started yet
+        self._pending: Dict[str, MCPServerConfig] = {}
+        # pending servers whose tools are known from the discovery cache
+        self._cached_tools: Dict[str, List[Dict[str, Any]]] = {}
+        self._connect_lock = asyncio.Lock()
+        # caps concurrent subprocess spawns when many servers start together
+        self._init_slots = asyncio.Semaphore(max_concurrent_init)
+        # (monotonic timestamp, tools) from the last list_all_tools
+        self._all_tools_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        self._all_tools_cache_lock = asyncio.Lock()
+        # server_name -> (client's tools list, its _server-tagged copies)
+        self._tagged_tools: Dict[str, Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]] = {}
+
+    def register_servers(self) -> None:
+        """
+        Register all configured servers without starting them.
+
+        Each server is started by the first call_tool (or list_all_tools)
+        that needs it. Tools a server declares under an optional "tools" key
+        in its config are routed to it without connecting first.
+        """
+        for server_name, server_config in self.config.items():
+            if server_name in self.clients:
+                continue
+
+            config = MCPServerConfig.from_dict(server_name, server_config)
+            self._pending[server_name] = config
+            for tool_name in server_config.get("tools", []):
+                self._tool_registry[tool_name] = server_name
+            self._register_cached(config)
+
+    def _register_cached(self, config: MCPServerConfig) -> bool:
+        """Route a server's tools from the discovery cache; False on a miss."""
+        tools = self._discovery.get(config) if self._discovery else None
+        if tools is None:
+            return False
+
+        for tool in tools:
+            tool["name"] = sys.intern(tool["name"])
+            self._tool_registry[tool["name"]] = config.name
+            if _is_read_only(tool):
+                self._coalesce.add(tool["name"])
+        self._cached_tools[config.name] = tools
+        return True
+
+    async def _connect(self, server_names: List[str]) -> None:
+        """Start pending servers concurrently and register the tools they expose."""
+        async with self._connect_lock:
+            # a concurrent caller may have started some of them already
+            configs = [
+                self._pending.pop(name) for name in server_names if name in self._pending
+            ]
+            results = await asyncio.gather(
+                *(self._start_client(config) for config in configs),
+                return_exceptions=True,
+            )
+
+            errors = []
+            for config, result in zip(configs, results):
+                if isinstance(result, Exception):
+                    # keep it pending so a later call can retry
+                    self._pending[config.name] = config
+                    errors.append(result)
+                    continue
+
+                client, tools = result
+                for tool in tools:
+                    self._tool_registry[tool["name"]] = config.name
+                    if _is_read_only(tool):
+                        self._coalesce.add(tool["name"])
+                self.clients[config.name] = client
+                self._cached_tools.pop(config.name, None)
+                self._route_to(config.name, client)
+                logger.info("Connected '%s' with %d tools", config.name, len(tools))
+
+                self._all_tools_cache = None
+
+            if errors:
+                raise errors[0]
+
+    async def _start_client(
+        self, config: MCPServerConfig
+    ) -> Tuple[MCPClient, List[Dict[str, Any]]]:
+        """Start one server and list its tools, stopping it again on failure."""
+        client = MCPClient(config)
+        async with self._init_slots:
+            try:
+                tools = await client.start_and_list()
+            except Exception:
+                await client.stop()
+                raise
+
+        if self._discovery:
+            await self._discovery.put_async(config, tools)
+        return client, tools
+
+    def _undiscovered(self) -> List[str]:
+        """Pending servers whose tools are not known yet."""
+        return [name for name in self._pending if name not in self._cached_tools]
+
+    def _route_to(self, server_name: str, client: MCPClient) -> None:
+        """Point every registered tool of a connected server straight at its client."""
+        for tool_name, owner in self._tool_registry.items():
+            if owner == server_name:
+                self._tool_to_client[tool_name] = client
 
     async def initialize_servers(self) -> None:
         """
         Initialize all configured MCP server connections.
 
         Starts each server, performs handshake, and builds tool registry.
+        Servers that are already connected are left as they are; servers
+        found in the discovery cache are registered and started lazily.
 
         Raises
         ------
         RuntimeError
             If any server fails to initialize
         """
-        logger.info(f"Initializing {len(self.config)} MCP servers")
-
-        for server_name, server_config in self.config.items():
-            try:
-                config = MCPServerConfig(
-                    name=server_name,
-                    command=server_config["command"],
-                    args=server_config["args"],
-                    env=server_config.get("env")
-                )
-
-                client = MCPClient(config)
-                await client.start()
-
-                # Discover tools
-                tools = await client.list_tools()
-                for tool in tools:
-                    tool_name = tool["name"]
-                    self._tool_registry[tool_name] = server_name
-                    logger.info(f"Registered tool '{tool_name}' from '{server_name}'")
-
-                self.clients[server_name] = client
-
-            except Exception as e:
-                logger.error(f"Failed to initialize server '{server_name}': {e}")
+        logger.info("Initializing %d MCP servers", len(self.config))
+
+        # each config is built once and used for both the cache check and the start
+        configs = []
+        for name, server_config in self.config.items():
+            if name in self.clients:
+                continue
+
+            config = MCPServerConfig.from_dict(name, server_config)
+            if self._register_cached(config):
+                self._pending[name] = config
+                logger.info("Registered '%s' from discovery cache", name)
+            else:
+                configs.append(config)
+
+        # servers are independent, bring them up concurrently
+        results = await asyncio.gather(
+            *(self._start_client(config) for config in configs),
+            return_exceptions=True,
+        )
+        server_names = [config.name for config in configs]
+
+        successful = []
+        for server_name, result in zip(server_names, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to initialize server '%s': %s", server_name, result)
                 # Continue with other servers
+                continue
 
-        if not self.clients:
+            client, tools = result
+            successful.append((server_name, client, tools))
+            logger.info("Registered %d tools from '%s'", len(tools), server_name)
+            if logger.isEnabledFor(logging.DEBUG):
+                for tool in tools:
+                    logger.debug("  tool=%s", tool["name"])
+
+        self.clients.update((name, client) for name, client, _ in successful)
+        self._tool_registry.update(
+            (tool["name"], name) for name, _, tools in successful for tool in tools
+        )
+        self._tool_to_client.update(
+            (tool["name"], client) for _, client, tools in successful for tool in tools
+        )
+        self._coalesce.update(
+            tool["name"] for _, _, tools in successful for tool in tools if _is_read_only(tool)
+        )
+        for name, _, _ in successful:
+            self._pending.pop(name, None)
+            self._cached_tools.pop(name, None)
+
+        self._all_tools_cache = None
+
+        if not self.clients and not self._cached_tools:
             raise RuntimeError("No MCP servers successfully initialized")
 
-        logger.info(f"Initialized {len(self.clients)} servers with {len(self._tool_registry)} total tools")
+        logger.info(
+            "Initialized %d servers with %d total tools", len(self.clients), len(self._tool_registry)
+        )
 
     async def list_all_tools(self) -> List[Dict[str, Any]]:
         """
         Get all available tools from all servers.
 
+        The catalog is cached for TOOLS_CACHE_TTL seconds and dropped whenever
+        a server is started or shut down.
+
         Returns
         -------
         List[Dict[str, Any]]
             Combined list of all tools with server name added
         """
-        all_tools = []
+        cached = self._all_tools_cache
+        if cached is not None and time.monotonic() - cached[0] < TOOLS_CACHE_TTL:
+            return list(cached[1])
+
+        async with self._all_tools_cache_lock:
+            cached = self._all_tools_cache
+            if cached is not None and time.monotonic() - cached[0] < TOOLS_CACHE_TTL:
+                return list(cached[1])
+
+            # servers known from the discovery cache are listed without starting them
+            uncached = self._undiscovered()
+            if uncached:
+                await self._connect(uncached)
+
+            all_tools = []
+
+            # one independent round trip per server, issue them together
+            server_names = list(self.clients)
+            results = await asyncio.gather(
+                *(self.clients[name].list_tools() for name in server_names),
+                return_exceptions=True,
+            )
 
-        for server_name, client in self.clients.items():
-            try:
-                tools = await client.list_tools()
-                for tool in tools:
-                    tool["_server"] = server_name  # Add server metadata
-                    all_tools.append(tool)
-            except Exception as e:
-                logger.error(f"Failed to list tools from '{server_name}': {e}")
+            server_names.extend(self._cached_tools)
+            results.extend(self._cached_tools.values())
 
-        return all_tools
+            for server_name, result in zip(server_names, results):
+                if isinstance(result, Exception):
+                    logger.error("Failed to list tools from '%s': %s", server_name, result)
+                    continue
+
+                # tag copies, the client's cached tool dicts must stay untouched;
+                # redone only when the client fetched a new list
+                tagged = self._tagged_tools.get(server_name)
+                if tagged is None or tagged[0] is not result:
+                    tagged = (result, [{**tool, "_server": server_name} for tool in result])
+                    self._tagged_tools[server_name] = tagged
+                all_tools.extend(tagged[1])
+
+            self._all_tools_cache = (time.monotonic(), all_tools)
+
+        return list(all_tools)
 
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
         """
@@ -353,8 +948,45 @@ class MCPToolManager:
             If tool is not found in registry
         RuntimeError
             If tool execution fails
+
+        Notes
+        -----
+        Concurrent calls to a tool annotated readOnlyHint with identical
+        arguments share a single request and receive the same result object.
         """
+        if tool_name in self._coalesce:
+            try:
+                key = (tool_name, orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS))
+            except TypeError:
+                return await self._call_tool(tool_name, arguments)
+
+            task = self._inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(self._call_tool(tool_name, arguments))
+                self._inflight[key] = task
+                task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+            # one caller being cancelled must not cancel the shared request
+            return await asyncio.shield(task)
+
+        return await self._call_tool(tool_name, arguments)
+
+    async def _call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
+        """Route a single tool call to its server, connecting it if needed."""
+        client = self._tool_to_client.get(tool_name)
+        if client is not None:
+            return await client.call_tool(tool_name, arguments)
+
         server_name = self._tool_registry.get(tool_name)
+
+        if self._pending and server_name not in self.clients:
+            # an undeclared tool could live on any server not started yet
+            await self._connect([server_name] if server_name else self._undiscovered())
+            client = self._tool_to_client.get(tool_name)
+            if client is not None:
+                return await client.call_tool(tool_name, arguments)
+            server_name = self._tool_registry.get(tool_name)
+
         if not server_name:
             raise ValueError(f"Unknown tool: {tool_name}")
 
@@ -368,11 +1000,21 @@ class MCPToolManager:
         """Gracefully shutdown all MCP server connections."""
         logger.info("Shutting down all MCP servers")
 
-        for client in self.clients.values():
-            try:
-                await client.stop()
-            except Exception as e:
-                logger.error(f"Error stopping server: {e}")
+        # each stop waits on its own subprocess, close them all at once
+        await asyncio.gather(*(self._safe_stop(client) for client in self.clients.values()))
 
         self.clients.clear()
         self._tool_registry.clear()
+        self._tool_to_client.clear()
+        self._coalesce.clear()
+        self._tagged_tools.clear()
+        self._cached_tools.clear()
+        self._pending.clear()
+        self._all_tools_cache = None
+
+    async def _safe_stop(self, client: MCPClient) -> None:
+        """Stop one client, logging rather than raising on failure."""
+        try:
+            await client.stop()
+        except Exception as e:
+            logger.error("Error stopping server '%s': %s", client.config.name, e)